@@ -0,0 +1,342 @@
+import argparse
+import asyncio
+import itertools
+import random
+import sys
+import time
+from collections import defaultdict, deque
+
+from cogs.automod import AutoMod, DEFAULT_THRESHOLDS
+from utils.automod_pool import EvaluationPool
+from utils.configstore import ConfigStore
+from utils.profanity import DEFAULT_WORDLIST
+from utils.raid import RaidBucket, RaidWindow
+from utils.windows import SlidingWindow, WindowEntry
+from utils.similarity import MessageFingerprint
+
+VOCABULARY = (
+    "hey guys anyone up for ranked tonight i think the new patch is pretty good "
+    "but the servers keep lagging lol did you see the stream yesterday it was "
+    "actually insane gg wp see you later thanks for the help with my build "
+    "check this out https://example.com/clip 😀 🔥 <:pog:123456789012345678>"
+).split()
+
+ALL_RULES = (
+    "blocked_words",
+    "blocked_links",
+    "profanity_filter",
+    "spam_detection",
+    "emoji_spam_detection",
+    "flood_control",
+    "raid_detection",
+)
+
+
+class FakeBot:
+    def __init__(self):
+        self.config_store = ConfigStore(":memory:")
+
+
+class FakePermissions:
+    __slots__ = ("manage_messages", "send_messages")
+
+    def __init__(self):
+        self.manage_messages = True
+        self.send_messages = True
+
+
+class FakeMember:
+    __slots__ = ("id", "bot", "mention", "guild_permissions")
+
+    def __init__(self, member_id: int):
+        self.id = member_id
+        self.bot = False
+        self.mention = f"<@{member_id}>"
+        self.guild_permissions = FakePermissions()
+
+
+class FakeGuild:
+    __slots__ = ("id", "me")
+
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.me = FakeMember(0)
+
+
+class FakeChannel:
+    __slots__ = ("id", "guild")
+
+    def __init__(self, channel_id: int, guild: FakeGuild):
+        self.id = channel_id
+        self.guild = guild
+
+    def get_partial_message(self, message_id: int):
+        return FakeMessage(self.guild, self, None, "", message_id)
+
+    def permissions_for(self, _):
+        return self.guild.me.guild_permissions
+
+
+MESSAGE_IDS = itertools.count(1)
+
+
+class FakeMessage:
+    __slots__ = ("id", "guild", "channel", "author", "content")
+
+    def __init__(self, guild, channel, author, content, message_id=None):
+        self.id = next(MESSAGE_IDS) if message_id is None else message_id
+        self.guild = guild
+        self.channel = channel
+        self.author = author
+        self.content = content
+
+
+def make_rules(guilds: int, blocked_words: int, rng: random.Random):
+    with open(DEFAULT_WORDLIST, encoding="utf-8") as wordlist:
+        words = [line.strip() for line in wordlist if line.strip()]
+
+    rules = {}
+    for guild_id in range(1, guilds + 1):
+        guild_rules = {rule: True for rule in ALL_RULES}
+        guild_rules["blocked_words_list"] = [
+            f"{rng.choice(words)}{index}" for index in range(blocked_words)
+        ]
+        guild_rules["thresholds"] = dict(DEFAULT_THRESHOLDS)
+        rules[str(guild_id)] = guild_rules
+
+    # Flood bursts would otherwise always be caught by the spam check first.
+    rules[str(guilds + 1)] = {
+        "flood_control": True,
+        "thresholds": dict(DEFAULT_THRESHOLDS),
+    }
+    return rules, words
+
+
+def make_stream(args, rules, censor_words, rng: random.Random):
+    guilds = [FakeGuild(guild_id) for guild_id in range(1, args.guilds + 1)]
+    flood_guild = FakeGuild(args.guilds + 1)
+    channels = {
+        guild.id: [
+            FakeChannel(guild.id * 1000 + index, guild) for index in range(args.channels)
+        ]
+        for guild in guilds + [flood_guild]
+    }
+    members = [FakeMember(member_id) for member_id in range(1, args.users + 1)]
+
+    kinds = ("normal", "spam", "flood", "profanity", "blocked", "raid")
+    weights = (
+        max(
+            0.0,
+            1
+            - args.spam_ratio
+            - args.flood_ratio
+            - args.profanity_ratio
+            - args.blocked_ratio
+            - args.raid_ratio,
+        ),
+        args.spam_ratio,
+        args.flood_ratio,
+        args.profanity_ratio,
+        args.blocked_ratio,
+        args.raid_ratio,
+    )
+
+    stream = []
+    while len(stream) < args.messages:
+        guild = rng.choice(guilds)
+        channel = rng.choice(channels[guild.id])
+        author = rng.choice(members)
+        kind = rng.choices(kinds, weights)[0]
+        if kind == "flood":
+            guild = flood_guild
+            channel = rng.choice(channels[guild.id])
+        length = max(1, int(rng.expovariate(1 / args.mean_words)))
+
+        if kind == "spam":
+            content = " ".join(VOCABULARY[:length])
+            burst = DEFAULT_THRESHOLDS["spam_messages"] + 2
+        elif kind == "flood":
+            content = rng.choice(VOCABULARY)
+            burst = DEFAULT_THRESHOLDS["flood_messages"] + 2
+        else:
+            words = [rng.choice(VOCABULARY) for _ in range(length)]
+            if kind == "profanity":
+                words.insert(rng.randrange(len(words) + 1), rng.choice(censor_words))
+            elif kind == "blocked":
+                blocked_words = rules[str(guild.id)]["blocked_words_list"]
+                words.insert(rng.randrange(len(words) + 1), rng.choice(blocked_words))
+            content = " ".join(words)
+            burst = 1
+
+        if kind == "raid":
+            content = " ".join(rng.choice(VOCABULARY) for _ in range(length + 3))
+            for raider in rng.sample(members, DEFAULT_THRESHOLDS["raid_messages"] + 2):
+                stream.append(FakeMessage(guild, channel, raider, content))
+            continue
+
+        for _ in range(burst):
+            stream.append(FakeMessage(guild, channel, author, content))
+            if kind == "flood":
+                content = rng.choice(VOCABULARY)
+    return stream[: args.messages]
+
+
+def deep_size(obj, seen=None):
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif isinstance(
+        obj, (SlidingWindow, WindowEntry, MessageFingerprint, RaidWindow, RaidBucket)
+    ):
+        size += sum(
+            deep_size(getattr(obj, slot), seen)
+            for slot in type(obj).__slots__
+            if hasattr(obj, slot)
+        )
+    return size
+
+
+def percentile(samples, fraction: float):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def instrument(cog: AutoMod, timings, hits):
+    for guild_id in cog.rules:
+        pipeline = cog.get_pipeline(guild_id)
+        wrapped = []
+        for reason, check in pipeline:
+            def timed(message, view, reason=reason, check=check):
+                start = time.perf_counter_ns()
+                result = check(message, view)
+                timings[reason].append(time.perf_counter_ns() - start)
+                if result:
+                    hits[reason] += 1
+                return result
+
+            wrapped.append((reason, timed))
+        cog.pipelines[guild_id] = tuple(wrapped)
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    cog = AutoMod(FakeBot())
+    rules, censor_words = make_rules(args.guilds, args.blocked_words, rng)
+    cog.rules.update(rules)
+
+    deleted = 0
+
+    async def delete_message(message, reason, author_id=None):
+        nonlocal deleted
+        deleted += 1
+
+    cog.delete_message = delete_message
+
+    timings = defaultdict(list)
+    hits = defaultdict(int)
+    instrument(cog, timings, hits)
+
+    stream = make_stream(args, rules, censor_words, rng)
+    latencies = []
+    peak_user_messages = peak_recent_messages = peak_channel_contents = 0
+
+    for index, message in enumerate(stream):
+        message_start = time.perf_counter_ns()
+        await cog.on_message(message)
+        latencies.append(time.perf_counter_ns() - message_start)
+
+        if index % args.sample_every == 0 or index == len(stream) - 1:
+            peak_user_messages = max(peak_user_messages, deep_size(cog.user_messages))
+            peak_recent_messages = max(
+                peak_recent_messages, deep_size(cog.recent_messages)
+            )
+            peak_channel_contents = max(
+                peak_channel_contents, deep_size(cog.channel_contents)
+            )
+    elapsed = sum(latencies) / 1_000_000_000
+
+    print(
+        f"{len(stream)} messages, {args.guilds} guilds (+1 flood-only), {args.users} users, "
+        f"{args.channels} channels per guild, {args.blocked_words} blocked words"
+    )
+    print(f"throughput: {len(stream) / elapsed:,.0f} msg/s ({deleted} flagged)")
+    print(
+        f"on_message: p50 {percentile(latencies, 0.5) / 1000:.1f} us, "
+        f"p99 {percentile(latencies, 0.99) / 1000:.1f} us"
+    )
+    print(f"\n{'check':<14} {'evaluated':>10} {'hits':>8} {'p50 us':>9} {'p99 us':>9}")
+    for reason, samples in timings.items():
+        print(
+            f"{reason:<14} {len(samples):>10} {hits[reason]:>8} "
+            f"{percentile(samples, 0.5) / 1000:>9.1f} {percentile(samples, 0.99) / 1000:>9.1f}"
+        )
+    print(
+        f"\npeak user_messages:   {peak_user_messages / 1024:,.1f} KiB"
+        f"\npeak recent_messages: {peak_recent_messages / 1024:,.1f} KiB"
+        f"\npeak channel_contents: {peak_channel_contents / 1024:,.1f} KiB"
+    )
+
+
+async def run_pool(args):
+    rng = random.Random(args.seed)
+    cog = AutoMod(FakeBot())
+    rules, censor_words = make_rules(args.guilds, args.blocked_words, rng)
+    cog.rules.update(rules)
+    cog.pool = EvaluationPool(args.workers, cog.metrics)
+
+    deleted = 0
+
+    async def delete_message(message, reason, author_id=None):
+        nonlocal deleted
+        deleted += 1
+
+    cog.delete_message = delete_message
+    stream = make_stream(args, rules, censor_words, rng)
+
+    # Warm the workers up so process start-up is not part of the measurement.
+    await asyncio.gather(*(cog.on_message(message) for message in stream[: args.workers * 4]))
+    deleted = 0
+
+    start = time.perf_counter()
+    await asyncio.gather(*(cog.on_message(message) for message in stream))
+    elapsed = time.perf_counter() - start
+    cog.pool.shutdown()
+
+    print(
+        f"{len(stream)} messages, {args.guilds} guilds, {args.workers} worker processes"
+    )
+    print(f"throughput: {len(stream) / elapsed:,.0f} msg/s ({deleted} flagged)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay synthetic traffic through AutoMod.")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--guilds", type=int, default=50)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--channels", type=int, default=5)
+    parser.add_argument("--blocked-words", type=int, default=200)
+    parser.add_argument("--spam-ratio", type=float, default=0.05)
+    parser.add_argument("--flood-ratio", type=float, default=0.05)
+    parser.add_argument("--profanity-ratio", type=float, default=0.05)
+    parser.add_argument("--blocked-ratio", type=float, default=0.02)
+    parser.add_argument("--raid-ratio", type=float, default=0.01)
+    parser.add_argument("--mean-words", type=float, default=12)
+    parser.add_argument("--sample-every", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(run_pool(args) if args.workers > 0 else run(args))
+
+
+if __name__ == "__main__":
+    main()
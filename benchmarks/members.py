@@ -0,0 +1,165 @@
+import argparse
+import gc
+import time
+import tracemalloc
+
+import discord
+from discord.state import ConnectionState
+
+JOINED_AT = "2024-01-01T00:00:00+00:00"
+
+
+def make_intents():
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.members = True
+    return intents
+
+
+def make_state(member_cache_flags, max_messages):
+    state = ConnectionState(
+        dispatch=lambda *args: None,
+        handlers={},
+        hooks={},
+        http=None,
+        intents=make_intents(),
+        member_cache_flags=member_cache_flags,
+        max_messages=max_messages,
+        chunk_guilds_at_startup=False,
+    )
+    state._get_client = lambda: None
+    state.user = None
+    return state
+
+
+def make_user(user_id: int):
+    return {
+        "id": str(user_id),
+        "username": f"user{user_id}",
+        "discriminator": "0",
+        "avatar": None,
+        "global_name": None,
+    }
+
+
+def make_guild(guild_id: int, members: int):
+    return {
+        "id": str(guild_id),
+        "name": f"guild {guild_id}",
+        "owner_id": str(guild_id * 10_000),
+        "member_count": members,
+        "roles": [
+            {
+                "id": str(guild_id),
+                "name": "@everyone",
+                "permissions": "0",
+                "position": 0,
+                "color": 0,
+                "hoist": False,
+                "managed": False,
+                "mentionable": False,
+            }
+        ],
+        "channels": [
+            {
+                "id": str(guild_id + 1),
+                "type": 0,
+                "name": "general",
+                "position": 0,
+                "permission_overwrites": [],
+            }
+        ],
+        "members": [
+            {
+                "user": make_user(guild_id * 10_000 + index),
+                "roles": [],
+                "joined_at": JOINED_AT,
+                "deaf": False,
+                "mute": False,
+                "flags": 0,
+            }
+            for index in range(members)
+        ],
+    }
+
+
+def make_message(message_id: int, guild_id: int, author_id: int):
+    return {
+        "id": str(message_id),
+        "channel_id": str(guild_id + 1),
+        "guild_id": str(guild_id),
+        "author": make_user(author_id),
+        "member": {"roles": [], "joined_at": JOINED_AT, "deaf": False, "mute": False, "flags": 0},
+        "content": "hey guys anyone up for ranked tonight",
+        "timestamp": JOINED_AT,
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+    }
+
+
+def run(name: str, member_cache_flags, max_messages, guilds: int, members: int, messages: int):
+    payloads = [make_guild((index + 1) * 1_000_000, members) for index in range(guilds)]
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    state = make_state(member_cache_flags, max_messages)
+    for payload in payloads:
+        state._add_guild_from_data(payload)
+    for index in range(messages):
+        guild = state.guilds[index % guilds]
+        channel = guild.text_channels[0]
+        data = make_message(index + 1, guild.id, guild.id * 10_000 + index % members)
+        message = state.create_message(channel=channel, data=data)
+        if state._messages is not None:
+            state._messages.append(message)
+
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    cached_members = sum(len(guild._members) for guild in state.guilds)
+    cached_messages = len(state._messages) if state._messages is not None else 0
+    print(
+        f"{name:<8} {current / 1024**2:>9.1f} MB {peak / 1024**2:>9.1f} MB peak "
+        f"{cached_members:>9} members {cached_messages:>7} messages {elapsed:>7.2f}s"
+    )
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare default and lean member caching.")
+    parser.add_argument("--guilds", type=int, default=50)
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--max-messages", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{args.guilds} guilds x {args.members} members, {args.messages} messages\n")
+    default = run(
+        "default",
+        discord.MemberCacheFlags.from_intents(make_intents()),
+        1000,
+        args.guilds,
+        args.members,
+        args.messages,
+    )
+    lean = run(
+        "lean",
+        discord.MemberCacheFlags.none(),
+        args.max_messages,
+        args.guilds,
+        args.members,
+        args.messages,
+    )
+    print(f"\nlean mode uses {lean / default:.1%} of the default cache memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import random
+import time
+
+from better_profanity import profanity
+
+from utils.profanity import ProfanityFilter
+
+VOCABULARY = (
+    "hey guys anyone up for ranked tonight i think the new patch is pretty good "
+    "but the servers keep lagging lol did you see the stream yesterday it was "
+    "actually insane gg wp see you later thanks for the help with my build"
+).split()
+
+LEETSPEAK = {"a": "@4", "i": "1!", "o": "0", "e": "3", "s": "$5", "t": "7"}
+
+
+def make_messages(count: int, words: int, profane_ratio: float, seed: int):
+    rng = random.Random(seed)
+    censor_words = [str(word) for word in profanity.CENSOR_WORDSET]
+    messages = []
+    for _ in range(count):
+        tokens = [rng.choice(VOCABULARY) for _ in range(max(1, int(rng.expovariate(1 / words))))]
+        if rng.random() < profane_ratio:
+            word = "".join(
+                rng.choice(LEETSPEAK[char]) if char in LEETSPEAK and rng.random() < 0.3 else char
+                for char in rng.choice(censor_words)
+            )
+            tokens.insert(rng.randrange(len(tokens) + 1), word)
+        messages.append(" ".join(tokens))
+    return messages
+
+
+def run(name: str, check, messages):
+    start = time.perf_counter()
+    hits = sum(1 for message in messages if check(message))
+    elapsed = time.perf_counter() - start
+    per_message = elapsed / len(messages) * 1_000_000
+    print(f"{name:<16} {len(messages) / elapsed:>12,.0f} msg/s {per_message:>10.1f} us/msg {hits:>8} hits")
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ProfanityFilter with better_profanity.")
+    parser.add_argument("--messages", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profane-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    profanity.load_censor_words()
+    print(f"better_profanity load: {(time.perf_counter() - start) * 1000:.1f} ms")
+    start = time.perf_counter()
+    profanity_filter = ProfanityFilter()
+    print(f"ProfanityFilter load:  {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for words in (5, 20, 80):
+        messages = make_messages(args.messages, words, args.profane_ratio, args.seed)
+        print(f"\n~{words} words per message")
+        expected = run("better_profanity", profanity.contains_profanity, messages)
+        actual = run("ProfanityFilter", profanity_filter.contains_profanity, messages)
+        if expected != actual:
+            print(f"hit counts differ: {expected} vs {actual}")
+
+
+if __name__ == "__main__":
+    main()
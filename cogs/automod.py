@@ -1,100 +1,272 @@
 import asyncio
+import copy
 import json
-import datetime
-import time
 import os
-import re
+import time
 from collections import defaultdict
-from better_profanity import profanity
 import discord
 from discord import app_commands, ui, Embed
-from discord.ext import commands
-import aiofiles
-
-
-class AutoMod(commands.Cog):
+from discord.ext import commands, tasks
+from utils.automod_pool import EvaluationPool
+from utils.cluster import get_cluster
+from utils.configstore import get_config_store
+from utils.domains import normalize_domain
+from utils.filewatch import FileWatcher
+from utils.metrics import start_metrics_server
+from utils.ruleengine import (
+    AutoModEngine,
+    DEFAULT_THRESHOLDS,
+    EVICTION_BUDGET,
+    MessageRecord,
+)
+
+DELETION_BATCH_SECONDS = 1.5
+DELETION_BATCH_SIZE = 100
+RULES_WATCH_SECONDS = 5
+
+try:
+    AUTOMOD_WORKERS = int(os.getenv("AUTOMOD_WORKERS", "0"))
+except ValueError:
+    AUTOMOD_WORKERS = 0
+    print("Invalid AUTOMOD_WORKERS value. Running AutoMod checks in-process.")
+
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+try:
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+except ValueError:
+    METRICS_PORT = 0
+    print("Invalid METRICS_PORT value. The AutoMod metrics endpoint is disabled.")
+
+
+class AutoMod(AutoModEngine, commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.json_file = "automod_rules.json"
 
-        self.user_messages = defaultdict(lambda: defaultdict(list))
-        self.recent_messages = defaultdict(lambda: defaultdict(list))
+        self.store = get_config_store(bot)
+        super().__init__(self.store.namespace("automod"))
+        self.rules_watcher = None
+        self.file_rules = self.store.namespace("automod_file")
+        self.file_lock = asyncio.Lock()
+        self.dirty_guilds = set()
 
-        self.last_cleanup = time.time()
+        self.pool = EvaluationPool(AUTOMOD_WORKERS, self.metrics) if AUTOMOD_WORKERS > 0 else None
+        self.metrics_runner = None
 
-        profanity.load_censor_words()
+        self.deletion_queues = {}
+        self.deletion_tasks = set()
 
-        self.file_lock = asyncio.Lock()
+        self.guild_permissions = {}
+        self.channel_permissions = defaultdict(dict)
+
+    async def cog_load(self):
+        self.store.import_json("automod", self.json_file)
+        self.store.import_json("automod_file", self.json_file)
+        self.load_rules()
+        self.rules_watcher = FileWatcher(self.json_file)
+        async with self.file_lock:
+            await self.sync_rules_file()
+            self.dirty_guilds.update(
+                guild_id
+                for guild_id in self.rules.keys() | self.file_rules.keys()
+                if self.rules.get(guild_id) != self.file_rules.get(guild_id)
+            )
+            await self.flush_rules_file()
+
+        self.evict_expired_windows.start()
+        self.watch_rules_file.start()
+
+        if METRICS_PORT:
+            try:
+                # Each launcher cluster serves its own endpoint on
+                # METRICS_PORT + CLUSTER_ID so every process can be scraped.
+                self.metrics_runner = await start_metrics_server(
+                    self.metrics,
+                    METRICS_HOST,
+                    METRICS_PORT + get_cluster(self.bot).cluster_id,
+                )
+            except OSError as e:
+                print(f"Failed to start the AutoMod metrics endpoint: {e}")
 
-        self.rules = {}
+    async def cog_unload(self):
+        self.evict_expired_windows.cancel()
+        self.watch_rules_file.cancel()
+        async with self.file_lock:
+            await self.flush_rules_file()
+        if self.pool is not None:
+            self.pool.shutdown()
+        if self.metrics_runner is not None:
+            await self.metrics_runner.cleanup()
+
+    def get_guild_permissions(self, guild: discord.Guild):
+        permissions = self.guild_permissions.get(guild.id)
+        if permissions is None:
+            permissions = self.guild_permissions[guild.id] = guild.me.guild_permissions
+        return permissions
+
+    def get_channel_permissions(self, channel: discord.abc.GuildChannel):
+        key = (getattr(channel, "parent_id", None) or channel.id, channel.id)
+        channels = self.channel_permissions[channel.guild.id]
+        permissions = channels.get(key)
+        if permissions is None:
+            permissions = channels[key] = channel.permissions_for(channel.guild.me)
+        return permissions
+
+    def invalidate_permissions(self, guild_id: int, channel_id: int = None):
+        if channel_id is None:
+            self.guild_permissions.pop(guild_id, None)
+            self.channel_permissions.pop(guild_id, None)
+        elif guild_id in self.channel_permissions:
+            channels = self.channel_permissions[guild_id]
+            for key in [key for key in channels if key[0] == channel_id]:
+                del channels[key]
 
     @commands.Cog.listener()
-    async def on_ready(self):
-        await self.load_rules()
+    async def on_guild_role_update(self, before: discord.Role, _: discord.Role):
+        self.invalidate_permissions(before.guild.id)
 
-    async def load_rules(self):
-        async with self.file_lock:
-            if os.path.exists(self.json_file):
-                async with aiofiles.open(self.json_file, "r", encoding="utf-8") as file:
-                    content = await file.read()
-                    self.rules = json.loads(content)
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.invalidate_permissions(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, _: discord.Member, after: discord.Member):
+        if after.id == self.bot.user.id:
+            self.invalidate_permissions(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, _: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ):
+        if isinstance(after, discord.CategoryChannel):
+            self.channel_permissions.pop(after.guild.id, None)
+        else:
+            self.invalidate_permissions(after.guild.id, after.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.invalidate_permissions(channel.guild.id, channel.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.invalidate_permissions(guild.id)
+
+    def load_rules(self):
+        for _, guild_rules in self.rules.items():
+            self.apply_default_thresholds(guild_rules)
+
+        self.pipelines.clear()
+
+    def apply_default_thresholds(self, guild_rules: dict):
+        guild_rules.setdefault("thresholds", {})
+        for key, value in DEFAULT_THRESHOLDS.items():
+            guild_rules["thresholds"].setdefault(key, value)
+
+    def read_rules_file(self):
+        if not os.path.exists(self.json_file):
+            return {}
+        try:
+            with open(self.json_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Failed to read {self.json_file}: {e}")
+            return None
+
+        return {
+            str(guild_id): guild_rules
+            for guild_id, guild_rules in data.items()
+            if isinstance(guild_rules, dict)
+        }
+
+    def dump_rules_file(self, updates: dict):
+        data = {**self.file_rules, **updates}
+        temp_file = f"{self.json_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {guild_id: rules for guild_id, rules in data.items() if rules is not None},
+                f,
+                indent=4,
+            )
+        os.replace(temp_file, self.json_file)
+
+    async def flush_rules_file(self):
+        if not self.dirty_guilds:
+            return
+
+        dirty = self.dirty_guilds
+        self.dirty_guilds = set()
+        updates = {
+            guild_id: copy.deepcopy(self.rules.get(guild_id)) for guild_id in dirty
+        }
+        try:
+            await asyncio.to_thread(self.dump_rules_file, updates)
+        except OSError as e:
+            print(f"Failed to write {self.json_file}: {e}")
+            self.dirty_guilds |= dirty
+            return
+        self.rules_watcher.signature = self.rules_watcher.stat()
+
+        for guild_id, guild_rules in updates.items():
+            if guild_rules is None:
+                self.file_rules.pop(guild_id, None)
             else:
-                self.rules = {}
-
-            default_thresholds = {
-                "spam_messages": 5,
-                "spam_seconds": 10,
-                "flood_messages": 5,
-                "flood_seconds": 5,
-                "emoji_limit": 5,
-            }
-
-            for _, guild_rules in self.rules.items():
-                guild_rules.setdefault("thresholds", {})
-                for key, value in default_thresholds.items():
-                    guild_rules["thresholds"].setdefault(key, value)
-
-    async def save_rules(self):
-        async with self.file_lock:
-            async with aiofiles.open(self.json_file, "w", encoding="utf-8") as file:
-                await file.write(json.dumps(self.rules, indent=4))
+                self.file_rules[guild_id] = guild_rules
+            await self.store.save("automod_file", guild_id)
 
-    def cleanup_message_cache(self):
-        current_time = time.time()
-        if current_time - self.last_cleanup < 600:
+    async def sync_rules_file(self):
+        file_rules = await asyncio.to_thread(self.read_rules_file)
+        if file_rules is None:
             return
 
-        self.last_cleanup = current_time
-
-        for guild_id in list(self.user_messages.keys()):
-            for user_id in list(self.user_messages[guild_id].keys()):
-                self.user_messages[guild_id][user_id] = [
-                    msg
-                    for msg in self.user_messages[guild_id][user_id]
-                    if (
-                        datetime.datetime.now(datetime.timezone.utc) - msg["timestamp"]
-                    ).total_seconds()
-                    < 3600
-                ]
-                if not self.user_messages[guild_id][user_id]:
-                    del self.user_messages[guild_id][user_id]
-            if not self.user_messages[guild_id]:
-                del self.user_messages[guild_id]
-
-        for guild_id in list(self.recent_messages.keys()):
-            for channel_id in list(self.recent_messages[guild_id].keys()):
-                self.recent_messages[guild_id][channel_id] = [
-                    msg
-                    for msg in self.recent_messages[guild_id][channel_id]
-                    if (
-                        datetime.datetime.now(datetime.timezone.utc) - msg["timestamp"]
-                    ).total_seconds()
-                    < 3600
-                ]
-                if not self.recent_messages[guild_id][channel_id]:
-                    del self.recent_messages[guild_id][channel_id]
-            if not self.recent_messages[guild_id]:
-                del self.recent_messages[guild_id]
+        changed = [
+            guild_id
+            for guild_id in file_rules.keys() | self.file_rules.keys()
+            if file_rules.get(guild_id) != self.file_rules.get(guild_id)
+        ]
+        for guild_id in changed:
+            self.dirty_guilds.discard(guild_id)
+            if guild_id in file_rules:
+                guild_rules = self.rules.setdefault(guild_id, {})
+                guild_rules.clear()
+                guild_rules.update(copy.deepcopy(file_rules[guild_id]))
+                self.apply_default_thresholds(guild_rules)
+                self.file_rules[guild_id] = file_rules[guild_id]
+                if guild_rules != file_rules[guild_id]:
+                    self.dirty_guilds.add(guild_id)
+            else:
+                self.rules.pop(guild_id, None)
+                self.file_rules.pop(guild_id, None)
+            self.compile_rules(guild_id)
+            await self.store.save("automod", guild_id)
+            await self.store.save("automod_file", guild_id)
+
+        if changed:
+            print(
+                f"Reloaded AutoMod rules for {len(changed)} server(s) from {self.json_file}."
+            )
+
+    @tasks.loop(seconds=RULES_WATCH_SECONDS)
+    async def watch_rules_file(self):
+        if self.rules_watcher is None:
+            return
+        async with self.file_lock:
+            if self.rules_watcher.changed():
+                await self.sync_rules_file()
+            await self.flush_rules_file()
+
+    async def save_rules(self, guild_id: str = None):
+        if guild_id is None:
+            self.pipelines.clear()
+            await self.store.save_all("automod")
+            self.dirty_guilds.update(self.rules.keys() | self.file_rules.keys())
+        else:
+            self.compile_rules(guild_id)
+            await self.store.save("automod", guild_id)
+            self.dirty_guilds.add(guild_id)
+
+    @tasks.loop(seconds=1)
+    async def evict_expired_windows(self):
+        self.evict_expired(time.monotonic(), EVICTION_BUDGET)
 
     @app_commands.command(
         name="automod",
@@ -109,9 +281,7 @@ class AutoMod(commands.Cog):
             )
             return
 
-        bot_member = await interaction.guild.fetch_member(self.bot.user.id)
-
-        if not bot_member.guild_permissions.manage_messages:
+        if not interaction.guild.me.guild_permissions.manage_messages:
             await interaction.response.send_message(
                 "⚠️ I don't have the 'Manage Messages' permission, which is required for AutoMod to function properly.",
                 ephemeral=True,
@@ -119,7 +289,7 @@ class AutoMod(commands.Cog):
             return
 
         guild_id = str(interaction.guild_id)
-        rules = self.rules.get(guild_id, {})
+        rules = self.rules.setdefault(guild_id, {})
 
         view = AutoModMainMenu(self, guild_id, rules)
         await interaction.response.send_message(
@@ -133,165 +303,88 @@ class AutoMod(commands.Cog):
         if message.author.bot or message.guild is None:
             return
 
-        if not message.guild.me.guild_permissions.manage_messages:
+        pipeline = self.get_pipeline(str(message.guild.id))
+        if not pipeline:
             return
 
-        self.cleanup_message_cache()
-
-        guild_id = str(message.guild.id)
-        rules = self.rules.get(guild_id, {})
-
-        thresholds = rules.get(
-            "thresholds",
-            {
-                "spam_messages": 5,
-                "spam_seconds": 10,
-                "flood_messages": 5,
-                "flood_seconds": 5,
-                "emoji_limit": 5,
-            },
-        )
-
-        if rules.get("blocked_words", False):
-            blocked_words = rules.get("blocked_words_list", [])
-            if any(word.lower() in message.content.lower() for word in blocked_words):
-                await self.delete_message(message, "blocked word")
-                return
-
-        if rules.get("blocked_links", False):
-            if self.contains_link(message.content):
-                await self.delete_message(message, "blocked link")
-                return
-
-        if rules.get("profanity_filter", False):
-            if self.contains_profanity(message.content):
-                await self.delete_message(message, "profanity")
-                return
-
-        if rules.get("spam_detection", False):
-            if await self.is_spam(
-                message, thresholds["spam_messages"], thresholds["spam_seconds"]
-            ):
-                await self.delete_message(message, "spam")
-                return
-
-        if rules.get("emoji_spam_detection", False):
-            if self.contains_emoji_spam(message.content, thresholds["emoji_limit"]):
-                await self.delete_message(message, "emoji spam")
-                return
-
-        if rules.get("flood_control", False):
-            if await self.is_flood(
-                message, thresholds["flood_messages"], thresholds["flood_seconds"]
-            ):
-                await self.delete_message(message, "flood")
-                return
-
-    async def delete_message(self, message: discord.Message, reason: str):
-        try:
-            await message.delete()
-            permissions = message.channel.permissions_for(message.guild.me)
-            if permissions.send_messages:
-                try:
-                    await message.channel.send(
-                        f"{message.author.mention}, your message was deleted due to {reason}.",
-                        delete_after=5,
-                    )
-                except discord.errors.HTTPException:
-                    pass
-        except discord.errors.NotFound:
-            pass
-        except discord.errors.Forbidden:
-            pass
-
-    def contains_link(self, content: str):
-        link_pattern = r"https?://\S+|www\.\S+"
-        return bool(re.search(link_pattern, content))
-
-    def contains_profanity(self, content: str):
-        return profanity.contains_profanity(content)
-
-    def contains_emoji_spam(self, content: str, emoji_limit: int = 5):
-        custom_emojis = re.findall(r"<a?:\w+:\d+>", content)
-        unicode_emojis = re.findall(
-            r"[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]",
-            content,
-        )
-
-        total_emojis = custom_emojis + unicode_emojis
-        return len(total_emojis) > emoji_limit
-
-    async def is_spam(
-        self, message: discord.Message, message_limit: int = 5, time_window: int = 10
-    ):
-        guild_id = message.guild.id
-        user_id = message.author.id
-        current_time = message.created_at
-
-        self.user_messages[guild_id][user_id].append(
-            {"content": message.content, "timestamp": current_time}
-        )
-
-        self.user_messages[guild_id][user_id] = [
-            msg
-            for msg in self.user_messages[guild_id][user_id]
-            if (current_time - msg["timestamp"]).total_seconds() < time_window
-        ]
-
-        if len(self.user_messages[guild_id][user_id]) > message_limit:
-            return True
-
-        similar_messages = [
-            msg
-            for msg in self.user_messages[guild_id][user_id]
-            if self.messages_similar(msg["content"], message.content)
-        ]
-
-        return len(similar_messages) > message_limit / 2
-
-    def messages_similar(self, msg1: str, msg2: str, threshold: float = 0.8):
-        if len(msg1) < 5 or len(msg2) < 5:
-            return msg1 == msg2
-
-        msg1 = re.sub(r"[^\w\s]", "", msg1.lower())
-        msg2 = re.sub(r"[^\w\s]", "", msg2.lower())
-
-        words1 = msg1.split()
-        words2 = msg2.split()
+        if not self.get_guild_permissions(message.guild).manage_messages:
+            return
 
-        if not words1 or not words2:
-            return False
+        record = MessageRecord.from_message(message)
+        if self.pool is None:
+            reason = self.evaluate(record)
+            related = self.take_related_messages()
+        else:
+            guild_id = str(message.guild.id)
+            reason, related = await self.pool.submit(
+                record, self.rules.get(guild_id), self.rule_versions[guild_id]
+            )
 
-        total_words = max(len(words1), len(words2))
-        matching_words = sum(1 for word in words1 if word in words2)
+        if reason is None:
+            return
 
-        return matching_words / total_words >= threshold
+        for message_id, author_id in related:
+            await self.delete_message(
+                message.channel.get_partial_message(message_id), reason, author_id
+            )
+        await self.delete_message(message, reason)
 
-    async def is_flood(
-        self, message: discord.Message, message_limit: int = 5, time_window: int = 5
+    async def delete_message(
+        self, message: discord.Message, reason: str, author_id: int = None
     ):
-        guild_id = message.guild.id
-        channel_id = message.channel.id
-        user_id = message.author.id
-        current_time = message.created_at
-
-        self.recent_messages[guild_id][channel_id].append(
-            {"user": user_id, "timestamp": current_time}
-        )
+        if author_id is None:
+            author_id = message.author.id
+        queue = self.deletion_queues.get(message.channel.id)
+        if queue is None:
+            queue = self.deletion_queues[message.channel.id] = []
+            task = asyncio.create_task(self.flush_deletions(message.channel))
+            self.deletion_tasks.add(task)
+            task.add_done_callback(self.deletion_tasks.discard)
+        queue.append((message, author_id, reason))
+
+    async def flush_deletions(self, channel: discord.TextChannel):
+        await asyncio.sleep(DELETION_BATCH_SECONDS)
+        queued = self.deletion_queues.pop(channel.id, [])
+        if not queued:
+            return
 
-        self.recent_messages[guild_id][channel_id] = [
-            msg
-            for msg in self.recent_messages[guild_id][channel_id]
-            if (current_time - msg["timestamp"]).total_seconds() < time_window
-        ]
+        messages = list({message.id: message for message, _, _ in queued}.values())
+        for start in range(0, len(messages), DELETION_BATCH_SIZE):
+            batch = messages[start : start + DELETION_BATCH_SIZE]
+            try:
+                await channel.delete_messages(batch, reason="AutoMod")
+            except discord.errors.NotFound:
+                pass
+            except discord.errors.Forbidden:
+                return
+            except discord.errors.HTTPException:
+                for message in batch:
+                    try:
+                        await message.delete()
+                    except discord.errors.NotFound:
+                        pass
+                    except discord.errors.Forbidden:
+                        return
+
+        if not self.get_channel_permissions(channel).send_messages:
+            return
 
-        user_channel_messages = [
-            msg
-            for msg in self.recent_messages[guild_id][channel_id]
-            if msg.get("user") == user_id
-        ]
+        offenders = {}
+        for _, author_id, reason in queued:
+            reasons = offenders.setdefault(author_id, {})
+            reasons[reason] = reasons.get(reason, 0) + 1
 
-        return len(user_channel_messages) > message_limit
+        for author_id, reasons in offenders.items():
+            count = sum(reasons.values())
+            reason_text = ", ".join(reasons)
+            if count == 1:
+                warning = f"<@{author_id}>, your message was deleted due to {reason_text}."
+            else:
+                warning = f"<@{author_id}>, {count} of your messages were deleted due to {reason_text}."
+            try:
+                await channel.send(warning, delete_after=5)
+            except discord.errors.HTTPException:
+                pass
 
 
 class AutoModMainMenu(ui.View):
@@ -315,6 +408,14 @@ class AutoModMainMenu(ui.View):
             content="🔤 **AutoMod Word Filters**\nManage blocked words:", view=view
         )
 
+    @ui.button(label="Link Filters", style=discord.ButtonStyle.primary, emoji="🔗")
+    async def link_filters(self, interaction: discord.Interaction, _: ui.Button):
+        view = LinkFiltersView(self.cog, self.guild_id, self.rules)
+        await interaction.response.edit_message(
+            content="🔗 **AutoMod Link Filters**\nManage allowed and blocked domains:",
+            view=view,
+        )
+
     @ui.button(
         label="Threshold Settings", style=discord.ButtonStyle.primary, emoji="📊"
     )
@@ -332,16 +433,23 @@ class AutoModMainMenu(ui.View):
             "Spam Detection": "spam_detection",
             "Profanity Filter": "profanity_filter",
             "Emoji Spam Detection": "emoji_spam_detection",
+            "Text Spam Filter": "text_spam_detection",
             "Flood Control": "flood_control",
+            "Raid Detection": "raid_detection",
             "Word Filter": "blocked_words",
         }
 
-        thresholds = self.rules.get("thresholds", {})
-        spam_messages = thresholds.get("spam_messages", 5)
-        spam_seconds = thresholds.get("spam_seconds", 10)
-        flood_messages = thresholds.get("flood_messages", 5)
-        flood_seconds = thresholds.get("flood_seconds", 5)
-        emoji_limit = thresholds.get("emoji_limit", 5)
+        thresholds = {**DEFAULT_THRESHOLDS, **self.rules.get("thresholds", {})}
+        spam_messages = thresholds["spam_messages"]
+        spam_seconds = thresholds["spam_seconds"]
+        flood_messages = thresholds["flood_messages"]
+        flood_seconds = thresholds["flood_seconds"]
+        raid_messages = thresholds["raid_messages"]
+        raid_seconds = thresholds["raid_seconds"]
+        emoji_limit = thresholds["emoji_limit"]
+        caps_percent = thresholds["caps_percent"]
+        newline_limit = thresholds["newline_limit"]
+        zalgo_percent = thresholds["zalgo_percent"]
 
         embed = Embed(
             title="🛡 Server AutoMod Status",
@@ -359,7 +467,11 @@ class AutoModMainMenu(ui.View):
         threshold_status = (
             f"**Spam Detection**: {spam_messages} msgs in {spam_seconds}s\n"
             f"**Flood Control**: {flood_messages} msgs in {flood_seconds}s\n"
-            f"**Emoji Limit**: {emoji_limit} per message"
+            f"**Raid Detection**: {raid_messages} identical msgs from different users in {raid_seconds}s\n"
+            f"**Emoji Limit**: {emoji_limit} per message\n"
+            f"**Caps Limit**: {caps_percent}% of letters\n"
+            f"**Newline Limit**: {newline_limit} per message\n"
+            f"**Zalgo Limit**: {zalgo_percent}% combining marks"
         )
         embed.add_field(name="Thresholds", value=threshold_status, inline=False)
 
@@ -374,6 +486,17 @@ class AutoModMainMenu(ui.View):
                 blocked_words_str = blocked_words_str[:1021] + "..."
             embed.add_field(name="Blocked Words", value=blocked_words_str, inline=False)
 
+        for field_name, list_key in (
+            ("Allowed Domains", "allowed_domains_list"),
+            ("Blocked Domains", "blocked_domains_list"),
+        ):
+            domains = self.rules.get(list_key, [])
+            if domains:
+                domains_str = ", ".join(f"`{domain}`" for domain in domains)
+                if len(domains_str) > 1024:
+                    domains_str = domains_str[:1021] + "..."
+                embed.add_field(name=field_name, value=domains_str, inline=False)
+
         await interaction.response.edit_message(content="", embed=embed, view=self)
 
     @ui.button(label="Close", style=discord.ButtonStyle.danger, emoji="✖️")
@@ -401,7 +524,9 @@ class FeatureSettingsView(ui.View):
                 "emoji_spam_detection",
                 "Emoji Spam Detection",
             ),
+            (self.toggle_text_spam_detection, "text_spam_detection", "Text Spam"),
             (self.toggle_flood_control, "flood_control", "Flood Control"),
+            (self.toggle_raid_detection, "raid_detection", "Raid Detection"),
             (self.toggle_word_filter, "blocked_words", "Word Filter"),
         ]
 
@@ -423,7 +548,7 @@ class FeatureSettingsView(ui.View):
         new_value = not current_value
         self.rules[rule_name] = new_value
         self.cog.rules.setdefault(self.guild_id, {})[rule_name] = new_value
-        await self.cog.save_rules()
+        await self.cog.save_rules(self.guild_id)
 
         button.style = (
             discord.ButtonStyle.green if new_value else discord.ButtonStyle.red
@@ -460,12 +585,26 @@ class FeatureSettingsView(ui.View):
             interaction, "emoji_spam_detection", "Emoji Spam", button
         )
 
+    @ui.button(label="Text Spam: OFF", style=discord.ButtonStyle.red)
+    async def toggle_text_spam_detection(
+        self, interaction: discord.Interaction, button: ui.Button
+    ):
+        await self.toggle_rule(
+            interaction, "text_spam_detection", "Text Spam", button
+        )
+
     @ui.button(label="Flood Control: OFF", style=discord.ButtonStyle.red)
     async def toggle_flood_control(
         self, interaction: discord.Interaction, button: ui.Button
     ):
         await self.toggle_rule(interaction, "flood_control", "Flood Control", button)
 
+    @ui.button(label="Raid Detection: OFF", style=discord.ButtonStyle.red)
+    async def toggle_raid_detection(
+        self, interaction: discord.Interaction, button: ui.Button
+    ):
+        await self.toggle_rule(interaction, "raid_detection", "Raid Detection", button)
+
     @ui.button(label="Word Filter: OFF", style=discord.ButtonStyle.red)
     async def toggle_word_filter(
         self, interaction: discord.Interaction, button: ui.Button
@@ -579,7 +718,7 @@ class BlockedWordModal(ui.Modal):
         if self.is_remove:
             if word in self.rules["blocked_words_list"]:
                 self.rules["blocked_words_list"].remove(word)
-                await self.cog.save_rules()
+                await self.cog.save_rules(self.guild_id)
                 await interaction.response.send_message(
                     f"`{word}` has been removed from the blocked words list.",
                     ephemeral=True,
@@ -591,7 +730,7 @@ class BlockedWordModal(ui.Modal):
         else:
             if word not in self.rules["blocked_words_list"]:
                 self.rules["blocked_words_list"].append(word)
-                await self.cog.save_rules()
+                await self.cog.save_rules(self.guild_id)
                 await interaction.response.send_message(
                     f"`{word}` has been added to the blocked words list.",
                     ephemeral=True,
@@ -602,6 +741,137 @@ class BlockedWordModal(ui.Modal):
                 )
 
 
+class LinkFiltersView(ui.View):
+    def __init__(self, cog, guild_id, rules):
+        super().__init__(timeout=300)
+        self.cog = cog
+        self.guild_id = guild_id
+        self.rules = rules
+
+    @ui.button(label="View Domains", style=discord.ButtonStyle.primary)
+    async def view_domains(self, interaction: discord.Interaction, _: ui.Button):
+        allowed = self.rules.get("allowed_domains_list", [])
+        blocked = self.rules.get("blocked_domains_list", [])
+        if not allowed and not blocked:
+            await interaction.response.send_message(
+                "No allowed or blocked domains have been set.", ephemeral=True
+            )
+            return
+
+        allowed_str = ", ".join(f"`{domain}`" for domain in allowed) or "None"
+        blocked_str = ", ".join(f"`{domain}`" for domain in blocked) or "None"
+        message = f"**Allowed domains:**\n{allowed_str}\n**Blocked domains:**\n{blocked_str}"
+        if len(message) > 1900:
+            message = message[:1897] + "..."
+        await interaction.response.send_message(message, ephemeral=True)
+
+    @ui.button(label="Allow Domain", style=discord.ButtonStyle.green)
+    async def allow_domain(self, interaction: discord.Interaction, _: ui.Button):
+        modal = DomainModal(
+            title="Allow Domain",
+            cog=self.cog,
+            guild_id=self.guild_id,
+            rules=self.rules,
+            list_key="allowed_domains_list",
+        )
+        await interaction.response.send_modal(modal)
+
+    @ui.button(label="Block Domain", style=discord.ButtonStyle.red)
+    async def block_domain(self, interaction: discord.Interaction, _: ui.Button):
+        modal = DomainModal(
+            title="Block Domain",
+            cog=self.cog,
+            guild_id=self.guild_id,
+            rules=self.rules,
+            list_key="blocked_domains_list",
+        )
+        await interaction.response.send_modal(modal)
+
+    @ui.button(label="Remove Domain", style=discord.ButtonStyle.secondary)
+    async def remove_domain(self, interaction: discord.Interaction, _: ui.Button):
+        modal = DomainModal(
+            title="Remove Domain",
+            cog=self.cog,
+            guild_id=self.guild_id,
+            rules=self.rules,
+            list_key=None,
+        )
+        await interaction.response.send_modal(modal)
+
+    @ui.button(label="Back", style=discord.ButtonStyle.secondary)
+    async def back_button(self, interaction: discord.Interaction, _: ui.Button):
+        view = AutoModMainMenu(self.cog, self.guild_id, self.rules)
+        await interaction.response.edit_message(
+            content="🛡️ **AutoMod Control Panel**\nSelect an option to configure:",
+            view=view,
+        )
+
+
+class DomainModal(ui.Modal):
+    domain_input = ui.TextInput(
+        label="Enter domain", placeholder="e.g. youtube.com (covers subdomains)"
+    )
+
+    def __init__(self, title, cog, guild_id, rules, list_key):
+        super().__init__(title=title)
+        self.cog = cog
+        self.guild_id = guild_id
+        self.rules = rules
+        self.list_key = list_key
+
+    async def on_submit(self, interaction: discord.Interaction):
+        domain = normalize_domain(self.domain_input.value)
+
+        if not domain or "." not in domain:
+            await interaction.response.send_message(
+                "Please enter a valid domain.", ephemeral=True
+            )
+            return
+
+        if self.list_key is None:
+            removed = False
+            for list_key in ("allowed_domains_list", "blocked_domains_list"):
+                if domain in self.rules.get(list_key, []):
+                    self.rules[list_key].remove(domain)
+                    removed = True
+
+            if removed:
+                await self.cog.save_rules(self.guild_id)
+                await interaction.response.send_message(
+                    f"`{domain}` has been removed from the domain lists.",
+                    ephemeral=True,
+                )
+            else:
+                await interaction.response.send_message(
+                    f"`{domain}` is not in the domain lists.", ephemeral=True
+                )
+            return
+
+        other_key = (
+            "blocked_domains_list"
+            if self.list_key == "allowed_domains_list"
+            else "allowed_domains_list"
+        )
+        if domain in self.rules.get(other_key, []):
+            self.rules[other_key].remove(domain)
+
+        self.rules.setdefault(self.list_key, [])
+        list_name = "allowed" if self.list_key == "allowed_domains_list" else "blocked"
+
+        if domain not in self.rules[self.list_key]:
+            self.rules[self.list_key].append(domain)
+            await self.cog.save_rules(self.guild_id)
+            await interaction.response.send_message(
+                f"`{domain}` has been added to the {list_name} domains list.",
+                ephemeral=True,
+            )
+        else:
+            await interaction.response.send_message(
+                f"`{domain}` is already in the {list_name} domains list.",
+                ephemeral=True,
+            )
+
+
 class ThresholdSettingsView(ui.View):
     def __init__(self, cog, guild_id, rules):
         super().__init__(timeout=300)
@@ -610,14 +880,7 @@ class ThresholdSettingsView(ui.View):
         self.rules = rules
 
         if "thresholds" not in self.rules:
-            self.rules["thresholds"] = {
-                "spam_messages": 5,
-                "spam_seconds": 10,
-                "flood_messages": 5,
-                "flood_seconds": 5,
-                "emoji_limit": 5,
-            }
-            self.cog.save_rules()
+            self.rules["thresholds"] = DEFAULT_THRESHOLDS.copy()
 
     @ui.button(label="Spam Settings", style=discord.ButtonStyle.primary)
     async def spam_settings(self, interaction: discord.Interaction, _: ui.Button):
@@ -641,6 +904,17 @@ class ThresholdSettingsView(ui.View):
         )
         await interaction.response.send_modal(modal)
 
+    @ui.button(label="Raid Settings", style=discord.ButtonStyle.primary)
+    async def raid_settings(self, interaction: discord.Interaction, _: ui.Button):
+        modal = ThresholdModal(
+            title="Raid Detection Settings",
+            cog=self.cog,
+            guild_id=self.guild_id,
+            rules=self.rules,
+            threshold_type="raid",
+        )
+        await interaction.response.send_modal(modal)
+
     @ui.button(label="Emoji Limit", style=discord.ButtonStyle.primary)
     async def emoji_settings(self, interaction: discord.Interaction, _: ui.Button):
         modal = EmojiLimitModal(
@@ -651,6 +925,16 @@ class ThresholdSettingsView(ui.View):
         )
         await interaction.response.send_modal(modal)
 
+    @ui.button(label="Text Limits", style=discord.ButtonStyle.primary)
+    async def text_settings(self, interaction: discord.Interaction, _: ui.Button):
+        modal = TextLimitsModal(
+            title="Text Spam Settings",
+            cog=self.cog,
+            guild_id=self.guild_id,
+            rules=self.rules,
+        )
+        await interaction.response.send_modal(modal)
+
     @ui.button(label="Back", style=discord.ButtonStyle.secondary)
     async def back_button(self, interaction: discord.Interaction, _: ui.Button):
         view = AutoModMainMenu(self.cog, self.guild_id, self.rules)
@@ -668,28 +952,9 @@ class ThresholdModal(ui.Modal):
         self.rules = rules
         self.threshold_type = threshold_type
 
-        default_thresholds = {
-            "spam_messages": 5,
-            "spam_seconds": 10,
-            "flood_messages": 5,
-            "flood_seconds": 5,
-            "emoji_limit": 5,
-        }
-
-        if "thresholds" not in self.rules:
-            self.rules["thresholds"] = default_thresholds.copy()
-            self.cog.rules.setdefault(self.guild_id, {})[
-                "thresholds"
-            ] = default_thresholds.copy()
-            self.cog.save_rules()
-        else:
-            for key, value in default_thresholds.items():
-                if key not in self.rules["thresholds"]:
-                    self.rules["thresholds"][key] = value
-                    self.cog.rules.setdefault(self.guild_id, {}).setdefault(
-                        "thresholds", {}
-                    )[key] = value
-                    self.cog.save_rules()
+        self.rules.setdefault("thresholds", {})
+        for key, value in DEFAULT_THRESHOLDS.items():
+            self.rules["thresholds"].setdefault(key, value)
 
         thresholds = self.rules["thresholds"]
 
@@ -724,6 +989,12 @@ class ThresholdModal(ui.Modal):
                 )
                 return
 
+            if self.threshold_type == "raid" and messages < 2:
+                await interaction.response.send_message(
+                    "Raid detection needs at least 2 different users.", ephemeral=True
+                )
+                return
+
             if seconds < 1 or seconds > 300:
                 await interaction.response.send_message(
                     "Time window must be between 1 and 300 seconds.", ephemeral=True
@@ -742,7 +1013,7 @@ class ThresholdModal(ui.Modal):
                 f"{self.threshold_type}_seconds"
             ] = seconds
 
-            self.cog.save_rules()
+            await self.cog.save_rules(self.guild_id)
 
             await interaction.response.send_message(
                 f"{self.threshold_type.capitalize()} detection settings updated: {messages} messages in {seconds} seconds",
@@ -762,7 +1033,7 @@ class EmojiLimitModal(ui.Modal):
         self.guild_id = guild_id
         self.rules = rules
 
-        thresholds = self.rules.get("thresholds", {"emoji_limit": 5})
+        thresholds = {**DEFAULT_THRESHOLDS, **self.rules.get("thresholds", {})}
 
         self.emoji_limit = ui.TextInput(
             label=f"Max Emojis Per Message (Current: {thresholds['emoji_limit']})",
@@ -790,7 +1061,7 @@ class EmojiLimitModal(ui.Modal):
             self.cog.rules.setdefault(self.guild_id, {}).setdefault("thresholds", {})
             self.cog.rules[self.guild_id]["thresholds"]["emoji_limit"] = limit
 
-            self.cog.save_rules()
+            await self.cog.save_rules(self.guild_id)
 
             await interaction.response.send_message(
                 f"Emoji limit updated: maximum {limit} emojis per message",
@@ -803,5 +1074,88 @@ class EmojiLimitModal(ui.Modal):
             )
 
 
+class TextLimitsModal(ui.Modal):
+    def __init__(self, title, cog, guild_id, rules):
+        super().__init__(title=title)
+        self.cog = cog
+        self.guild_id = guild_id
+        self.rules = rules
+
+        thresholds = {**DEFAULT_THRESHOLDS, **self.rules.get("thresholds", {})}
+
+        self.caps_percent = ui.TextInput(
+            label=f"Max Caps % (Current: {thresholds['caps_percent']})",
+            placeholder="Maximum percentage of uppercase letters",
+            default=str(thresholds["caps_percent"]),
+            required=True,
+            min_length=1,
+            max_length=3,
+        )
+        self.add_item(self.caps_percent)
+
+        self.newline_limit = ui.TextInput(
+            label=f"Max Newlines (Current: {thresholds['newline_limit']})",
+            placeholder="Maximum number of line breaks per message",
+            default=str(thresholds["newline_limit"]),
+            required=True,
+            min_length=1,
+            max_length=2,
+        )
+        self.add_item(self.newline_limit)
+
+        self.zalgo_percent = ui.TextInput(
+            label=f"Max Combining Marks % (Current: {thresholds['zalgo_percent']})",
+            placeholder="Maximum percentage of combining (zalgo) characters",
+            default=str(thresholds["zalgo_percent"]),
+            required=True,
+            min_length=1,
+            max_length=3,
+        )
+        self.add_item(self.zalgo_percent)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        try:
+            caps_percent = int(self.caps_percent.value)
+            newline_limit = int(self.newline_limit.value)
+            zalgo_percent = int(self.zalgo_percent.value)
+
+            if caps_percent < 1 or caps_percent > 100:
+                await interaction.response.send_message(
+                    "Caps limit must be between 1 and 100 percent.", ephemeral=True
+                )
+                return
+
+            if newline_limit < 1 or newline_limit > 50:
+                await interaction.response.send_message(
+                    "Newline limit must be between 1 and 50.", ephemeral=True
+                )
+                return
+
+            if zalgo_percent < 1 or zalgo_percent > 100:
+                await interaction.response.send_message(
+                    "Combining mark limit must be between 1 and 100 percent.",
+                    ephemeral=True,
+                )
+                return
+
+            self.rules.setdefault("thresholds", {})
+            self.rules["thresholds"]["caps_percent"] = caps_percent
+            self.rules["thresholds"]["newline_limit"] = newline_limit
+            self.rules["thresholds"]["zalgo_percent"] = zalgo_percent
+
+            await self.cog.save_rules(self.guild_id)
+
+            await interaction.response.send_message(
+                f"Text spam settings updated: {caps_percent}% caps, {newline_limit} newlines, "
+                f"{zalgo_percent}% combining marks",
+                ephemeral=True,
+            )
+
+        except ValueError:
+            await interaction.response.send_message(
+                "Please enter valid numbers.", ephemeral=True
+            )
+
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(AutoMod(bot))
@@ -1,27 +1,20 @@
-import json
-import os
-
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from utils.configstore import get_config_store
+
 
 class AutoRole(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.filepath = "autorole_config.json"
-        self.load_config()
-
-    def load_config(self):
-        if not os.path.exists(self.filepath):
-            with open(self.filepath, "w", encoding="utf-8") as f:
-                json.dump({}, f)
-        with open(self.filepath, "r", encoding="utf-8") as f:
-            self.config = json.load(f)
+        self.store = get_config_store(bot)
+        self.store.import_json("autorole", self.filepath)
+        self.config = self.store.namespace("autorole")
 
-    def save_config(self):
-        with open(self.filepath, "w", encoding="utf-8") as f:
-            json.dump(self.config, f, indent=4)
+    async def save_config(self, guild_id: str):
+        await self.store.save("autorole", guild_id)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
@@ -82,7 +75,7 @@ class AutoRole(commands.Cog):
                 self.cog.config[guild_id]["enabled"] = not self.cog.config[guild_id][
                     "enabled"
                 ]
-                self.cog.save_config()
+                await self.cog.save_config(guild_id)
                 self.update_toggle_button()
                 status = (
                     "enabled" if self.cog.config[guild_id]["enabled"] else "disabled"
@@ -152,7 +145,7 @@ class RoleSelect(discord.ui.Select):
             self.cog.config[guild_id] = {"enabled": False, "role_id": None}
 
         self.cog.config[guild_id]["role_id"] = role_id
-        self.cog.save_config()
+        await self.cog.save_config(guild_id)
 
         role = self.interaction.guild.get_role(int(role_id))
         await interaction.response.send_message(
@@ -1,10 +1,12 @@
 import os
+import asyncio
 from asyncio import Lock
+import aiohttp
 import discord
-import requests
 from discord import app_commands, ui
 from discord.ext import commands
 from dotenv import load_dotenv
+from utils.http import get_http_session
 
 load_dotenv()
 
@@ -15,36 +17,30 @@ HEADERS = {"Authorization": f"Bearer {COC_API_KEY}", "Accept": "application/json
 BASE_URL = "https://api.clashofclans.com/v1"
 
 
-def get_player_info(player_tag):
-    url = f"{BASE_URL}/players/%23{player_tag.strip('#')}"
-    response = requests.get(url, headers=HEADERS, timeout=10)
-    if response.status_code == 200:
-        return response.json()
+async def fetch_json(session: aiohttp.ClientSession, url: str):
+    try:
+        async with session.get(url, headers=HEADERS) as response:
+            if response.status == 200:
+                return await response.json()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"Clash of Clans API request failed: {e}")
     return None
 
 
-def get_clan_info(clan_tag):
-    url = f"{BASE_URL}/clans/%23{clan_tag.strip('#')}"
-    response = requests.get(url, headers=HEADERS, timeout=10)
-    if response.status_code == 200:
-        return response.json()
-    return None
+async def get_player_info(session, player_tag):
+    return await fetch_json(session, f"{BASE_URL}/players/%23{player_tag.strip('#')}")
 
 
-def get_clan_warlog(clan_tag):
-    url = f"{BASE_URL}/clans/%23{clan_tag.strip('#')}/warlog"
-    response = requests.get(url, headers=HEADERS, timeout=10)
-    if response.status_code == 200:
-        return response.json()
-    return None
+async def get_clan_info(session, clan_tag):
+    return await fetch_json(session, f"{BASE_URL}/clans/%23{clan_tag.strip('#')}")
 
 
-def get_clan_members(clan_tag):
-    url = f"{BASE_URL}/clans/%23{clan_tag.strip('#')}/members"
-    response = requests.get(url, headers=HEADERS, timeout=10)
-    if response.status_code == 200:
-        return response.json()
-    return None
+async def get_clan_warlog(session, clan_tag):
+    return await fetch_json(session, f"{BASE_URL}/clans/%23{clan_tag.strip('#')}/warlog")
+
+
+async def get_clan_members(session, clan_tag):
+    return await fetch_json(session, f"{BASE_URL}/clans/%23{clan_tag.strip('#')}/members")
 
 
 class ClashMenuView(ui.View):
@@ -97,7 +93,7 @@ class ClashMenuView(ui.View):
                 return
 
             player_tag = msg.content.strip()
-            player_data = get_player_info(player_tag)
+            player_data = await get_player_info(get_http_session(self.bot), player_tag)
 
             if not player_data:
                 await interaction.followup.send(
@@ -168,7 +164,7 @@ class ClashMenuView(ui.View):
         try:
             msg = await self.bot.wait_for("message", check=check, timeout=30)
             clan_tag = msg.content.strip()
-            clan_data = get_clan_info(clan_tag)
+            clan_data = await get_clan_info(get_http_session(self.bot), clan_tag)
 
             if not clan_data:
                 await interaction.followup.send(
@@ -246,7 +242,7 @@ class ClashMenuView(ui.View):
         try:
             msg = await self.bot.wait_for("message", check=check, timeout=30)
             clan_tag = msg.content.strip()
-            warlog_data = get_clan_warlog(clan_tag)
+            warlog_data = await get_clan_warlog(get_http_session(self.bot), clan_tag)
 
             if not warlog_data or "items" not in warlog_data:
                 await interaction.followup.send(
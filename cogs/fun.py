@@ -4,10 +4,10 @@ import re
 import random
 import asyncio
 import discord
-import requests
-from bs4 import BeautifulSoup as bs
 from discord import app_commands
 from discord.ext import commands
+from utils.http import get_http_session
+from utils.members import get_member_cache
 
 class Fun(commands.Cog):
 
@@ -17,9 +17,10 @@ class Fun(commands.Cog):
     @app_commands.command(description="Dad jokes!")
     @app_commands.checks.cooldown(1, 2)
     async def dadjoke(self, interaction: discord.Interaction):
-        data = bs(
-            requests.get("https://icanhazdadjoke.com/", timeout=10).text, "html.parser"
-        )
+        from bs4 import BeautifulSoup as bs
+
+        async with get_http_session(self.bot).get("https://icanhazdadjoke.com/") as response:
+            data = bs(await response.text(), "html.parser")
         data = str(data.select("p")[0])
         joke = (
             re.findall('class="subtitle">.*</p>$', data)[0]
@@ -54,9 +55,8 @@ class Fun(commands.Cog):
     )
     @app_commands.checks.cooldown(1, 5)
     async def affirmation(self, interaction: discord.Interaction):
-        affirmation = json.loads(
-            requests.get("https://www.affirmations.dev/", timeout=10).text
-        )["affirmation"]
+        async with get_http_session(self.bot).get("https://www.affirmations.dev/") as response:
+            affirmation = json.loads(await response.text())["affirmation"]
         await interaction.response.send_message(
             embed=discord.Embed(description=affirmation, color=discord.Colour.blurple())
         )
@@ -89,6 +89,7 @@ class Fun(commands.Cog):
     @app_commands.checks.cooldown(1, 5)
     async def serverinfo(self, interaction: discord.Interaction):
         guild = interaction.guild
+        owner = guild.owner or await get_member_cache(self.bot).get(guild, guild.owner_id)
         embed = discord.Embed(
             title=f"Server Info - {guild.name}",
             color=discord.Colour.blurple(),
@@ -96,7 +97,7 @@ class Fun(commands.Cog):
         )
         embed.set_thumbnail(url=guild.icon)
         embed.add_field(name="ID", value=guild.id, inline=True)
-        embed.add_field(name="Owner", value=guild.owner.mention, inline=True)
+        embed.add_field(name="Owner", value=owner.mention if owner else f"<@{guild.owner_id}>", inline=True)
         embed.add_field(name="Created On", value=guild.created_at.strftime("%Y-%m-%d %H:%M:%S"), inline=False)
         embed.add_field(name="Member Count", value=guild.member_count, inline=True)
         embed.add_field(name="Text Channels", value=len(guild.text_channels), inline=True)
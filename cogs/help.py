@@ -154,14 +154,25 @@ class HelpView(discord.ui.View):
                 "🚫 Blocked Words",
                 "Block specific words that will be automatically deleted",
             ),
-            ("🔗 Link Blocker", "Prevent links from being posted in chat"),
+            (
+                "🔗 Link Blocker",
+                "Prevent links from being posted in chat, with per-domain allow and block lists",
+            ),
             (
                 "🔄 Spam Detection",
                 "Detect and prevent message spam based on similarity and frequency",
             ),
             ("🤐 Profanity Filter", "Censor offensive language in messages"),
             ("😀 Emoji Spam Detection", "Limit the number of emojis in messages"),
+            (
+                "🔠 Text Spam Filter",
+                "Limit excessive caps, line breaks and zalgo text in messages",
+            ),
             ("🌊 Flood Control", "Prevent rapid consecutive messages from users"),
+            (
+                "🚨 Raid Detection",
+                "Remove the same message when many different users post it at once",
+            ),
         ]
 
         for i, (name, value) in enumerate(features, 1):
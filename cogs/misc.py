@@ -2,6 +2,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from main import VERSION
+from utils.shards import format_shard_latencies
 
 
 class Misc(commands.Cog):
@@ -72,9 +73,14 @@ class Misc(commands.Cog):
     @app_commands.checks.cooldown(1, 2)
     async def ping(self, interaction: discord.Interaction):
         ping = round(self.bot.latency * 1000)
-        len(self.bot.guilds)
+        message = f"Pong! `{ping}ms`"
 
-        await interaction.response.send_message(f"Pong! `{ping}ms`", ephemeral=True)
+        if self.bot.shard_count:
+            shard_id = interaction.guild.shard_id if interaction.guild else 0
+            message += f" (average)\nThis server is on shard `{shard_id}`.\n"
+            message += format_shard_latencies(self.bot)
+
+        await interaction.response.send_message(message, ephemeral=True)
 
     @app_commands.command(description="Invite me!")
     @app_commands.checks.cooldown(1, 2)
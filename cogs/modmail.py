@@ -1,31 +1,11 @@
-import json
-import os
 import discord
 from discord import ui, Embed, Colour, TextStyle, Interaction
 from discord.ext import commands
 from discord import app_commands
 
-CONFIG_FILE = "modmail.json"
-
-if not os.path.exists(CONFIG_FILE):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as file:
-        json.dump({}, file, indent=4)
-
+from utils.configstore import get_config_store
 
-def load_config():
-    with open(CONFIG_FILE, "r", encoding="utf-8") as load_config_file:
-        try:
-            return json.load(load_config_file)
-        except json.JSONDecodeError:
-            return {}
-
-
-def save_config(config):
-    try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as save_config_file:
-            json.dump(config, save_config_file, indent=4)
-    except (IOError, json.JSONDecodeError) as e:
-        print(f"Failed to save configuration: {e}")
+CONFIG_FILE = "modmail.json"
 
 
 class ModmailModal(ui.Modal):
@@ -48,9 +28,7 @@ class ModmailModal(ui.Modal):
             )
             return
 
-        config = load_config()
-        guild_id = str(interaction.guild.id)
-        log_channel_id = config.get(guild_id)
+        log_channel_id = get_config_store(self.bot).get("modmail", interaction.guild.id)
 
         if log_channel_id:
             log_channel = self.bot.get_channel(log_channel_id)
@@ -113,9 +91,7 @@ class ChannelSelect(discord.ui.Select):
             return
 
         channel_id = int(self.values[0])
-        config = load_config()
-        config[str(interaction.guild.id)] = channel_id
-        save_config(config)
+        await get_config_store(self.bot).set("modmail", interaction.guild.id, channel_id)
 
         channel = self.guild.get_channel(channel_id)
         await interaction.response.send_message(
@@ -165,6 +141,7 @@ class ChannelSelectView(discord.ui.View):
 class Modmail(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        get_config_store(bot).import_json("modmail", CONFIG_FILE)
 
     @app_commands.command(
         name="setmodmail", description="Set the modmail log channel"
@@ -2,11 +2,17 @@ import os
 import sys
 import asyncio
 import datetime
-import psutil
+import io
 from dotenv import load_dotenv
 import discord
 from discord.ext import commands
 from discord.ui import View, button
+from utils.cluster import get_cluster
+from utils.errors import get_error_sink
+from utils.shards import format_shard_latencies
+from utils.treesync import sync_tree
+
+BROADCAST_TIMEOUT = 600
 
 load_dotenv()
 try:
@@ -28,6 +34,26 @@ def developer_only():
 class Restricted(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        get_cluster(bot).handlers["broadcast"] = self.broadcast_local
+
+    async def broadcast_local(self, message: str):
+        sent = 0
+        for guild in self.bot.guilds:
+            main_channel = guild.system_channel or next(
+                (
+                    channel
+                    for channel in guild.text_channels
+                    if channel.permissions_for(guild.me).send_messages
+                ),
+                None,
+            )
+            if main_channel:
+                try:
+                    await main_channel.send(message)
+                    sent += 1
+                except discord.Forbidden:
+                    continue
+        return sent
 
     @commands.command(name="devhelp")
     @developer_only()
@@ -73,6 +99,24 @@ class DeveloperDashboardView(View):
     ):
         await self.botstats(interaction)
 
+    @discord.ui.button(label="AutoMod Metrics", style=discord.ButtonStyle.green)
+    async def automod_metrics_button(
+        self, interaction: discord.Interaction, _: discord.ui.Button
+    ):
+        await self.automod_metrics(interaction)
+
+    @discord.ui.button(label="Recent Errors", style=discord.ButtonStyle.green)
+    async def recent_errors_button(
+        self, interaction: discord.Interaction, _: discord.ui.Button
+    ):
+        await self.recent_errors(interaction)
+
+    @discord.ui.button(label="Sync Commands", style=discord.ButtonStyle.blurple)
+    async def sync_commands_button(
+        self, interaction: discord.Interaction, _: discord.ui.Button
+    ):
+        await self.sync_commands(interaction)
+
     @discord.ui.button(label="Broadcast Message", style=discord.ButtonStyle.red)
     async def broadcast_button(
         self, interaction: discord.Interaction, _: discord.ui.Button
@@ -92,13 +136,18 @@ class DeveloperDashboardView(View):
         await self.test_broadcast(interaction)
 
     async def servers(self, interaction: discord.Interaction):
-        servers = [f"- {guild.name} - ({guild.id})" for guild in self.bot.guilds]
+        cluster_servers = await get_cluster(self.bot).gather("servers")
+        servers = [
+            f"- {name} - ({guild_id})"
+            for cluster in cluster_servers
+            for name, guild_id in cluster
+        ]
         try:
             with open("servers.txt", "w", encoding="utf-8") as f:
                 f.write("\n".join(servers))
             file = discord.File("servers.txt")
             await interaction.response.send_message(
-                f"I am in `{len(self.bot.guilds)}` different servers.",
+                f"I am in `{len(servers)}` different servers.",
                 file=file,
                 ephemeral=True,
             )
@@ -294,6 +343,9 @@ class DeveloperDashboardView(View):
                 "**Restart Bot -** Restarts the bot.\n"
                 "**Broadcast Message -** Broadcasts a message to all servers.\n"
                 "**Bot Statistics -** Displays bot statistics.\n"
+                "**Recent Errors -** Lists recent unique errors with repeat counts and full tracebacks.\n"
+                "**Sync Commands -** Forces a slash command sync with Discord.\n"
+                "**AutoMod Metrics -** Shows how often each AutoMod check runs, fires and how long it takes.\n"
             ),
             inline=False,
         )
@@ -352,23 +404,12 @@ class DeveloperDashboardView(View):
             response_message = done.pop().result()
             message = response_message.content
 
-            for guild in self.bot.guilds:
-                main_channel = guild.system_channel or next(
-                    (
-                        channel
-                        for channel in guild.text_channels
-                        if channel.permissions_for(guild.me).send_messages
-                    ),
-                    None,
-                )
-                if main_channel:
-                    try:
-                        await main_channel.send(message)
-                    except discord.Forbidden:
-                        continue
+            sent = await get_cluster(self.bot).gather(
+                "broadcast", timeout=BROADCAST_TIMEOUT, message=message
+            )
 
             await interaction.followup.send(
-                "Broadcast message sent to all servers.", ephemeral=True
+                f"Broadcast message sent to {sum(sent)} servers.", ephemeral=True
             )
 
         except asyncio.TimeoutError:
@@ -377,8 +418,8 @@ class DeveloperDashboardView(View):
             )
 
     async def botstats(self, interaction: discord.Interaction):
-        process = psutil.Process(os.getpid())
-        memory_usage = process.memory_info().rss / 1024**2
+        stats = await get_cluster(self.bot).gather("stats")
+        memory_usage = sum(cluster["memory"] for cluster in stats) / 1024**2
         uptime = datetime.datetime.now(datetime.timezone.utc) - self.bot.start_time
 
         embed = discord.Embed(title="Bot Statistics", color=discord.Color.blue())
@@ -388,15 +429,115 @@ class DeveloperDashboardView(View):
         embed.add_field(
             name="Memory Usage", value=f"{memory_usage:.2f} MB", inline=False
         )
-        embed.add_field(name="Servers", value=f"{len(self.bot.guilds)}", inline=False)
+        embed.add_field(
+            name="Servers",
+            value=f"{sum(cluster['guilds'] for cluster in stats)}",
+            inline=False,
+        )
         embed.add_field(
             name="Users",
-            value=f"{sum(g.member_count for g in self.bot.guilds)}",
+            value=f"{sum(cluster['users'] for cluster in stats)}",
             inline=False,
         )
+        if len(stats) > 1:
+            embed.add_field(
+                name="Clusters",
+                value="\n".join(
+                    f"Cluster {cluster['cluster']} (shards {cluster['shards'][0]}-{cluster['shards'][-1]}): "
+                    f"{cluster['guilds']} servers, {cluster['memory'] / 1024**2:.0f} MB"
+                    for cluster in stats
+                )[:1024],
+                inline=False,
+            )
+        embed.add_field(
+            name="Latency", value=format_shard_latencies(self.bot), inline=False
+        )
+        if self.bot.shard_count:
+            embed.add_field(
+                name="Shards",
+                value=f"{len(self.bot.shards)} of {self.bot.shard_count}",
+                inline=False,
+            )
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    async def sync_commands(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        try:
+            synced = await sync_tree(self.bot, force=True)
+        except discord.HTTPException as e:
+            await interaction.followup.send(
+                f"Error syncing commands: {str(e)}", ephemeral=True
+            )
+            return
+
+        self.bot.synced_commands = len(synced)
+        await interaction.followup.send(
+            f"Synced `{len(synced)}` application command(s).", ephemeral=True
+        )
+
+    async def automod_metrics(self, interaction: discord.Interaction):
+        automod = self.bot.get_cog("AutoMod")
+        if automod is None or not automod.metrics.totals:
+            await interaction.response.send_message(
+                "No AutoMod checks have run yet.", ephemeral=True
+            )
+            return
+
+        metrics = automod.metrics
+        rows = [f"{'check':<14} {'runs':>8} {'hits':>6} {'avg us':>7} {'p99 us':>7}"]
+        for check, stats in sorted(
+            metrics.totals.items(), key=lambda item: item[1].total_ns, reverse=True
+        ):
+            average = stats.total_ns / stats.evaluations / 1000
+            p99 = stats.quantile(0.99) * 1_000_000
+            p99_text = f"{p99:>7.0f}" if p99 != float("inf") else f"{'>25000':>7}"
+            rows.append(
+                f"{check:<14} {stats.evaluations:>8} {stats.hits:>6} {average:>7.1f} {p99_text}"
+            )
+
+        embed = discord.Embed(title="AutoMod Metrics", color=discord.Color.blue())
+        embed.add_field(
+            name="All Servers", value="```\n" + "\n".join(rows) + "\n```", inline=False
+        )
+
+        busiest = []
+        for guild_id, total_ns in metrics.busiest_guilds():
+            guild = self.bot.get_guild(guild_id)
+            name = guild.name if guild else guild_id
+            runs = sum(stats.evaluations for stats in metrics.guilds[guild_id].values())
+            hits = sum(stats.hits for stats in metrics.guilds[guild_id].values())
+            busiest.append(
+                f"**{name}** - {runs} checks, {hits} hits, {total_ns / 1_000_000:.1f} ms"
+            )
+        embed.add_field(name="Busiest Servers", value="\n".join(busiest), inline=False)
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    async def recent_errors(self, interaction: discord.Interaction):
+        records = get_error_sink(self.bot).recent()
+        if not records:
+            await interaction.response.send_message(
+                "No errors have been recorded yet.", ephemeral=True
+            )
+            return
+
+        embed = discord.Embed(title="Recent Errors", color=discord.Color.red())
+        embed.description = "\n".join(
+            f"`{record.fingerprint}` **{record.kind}** in {record.source} "
+            f"x{record.count} - last <t:{int(record.last_seen)}:R>"
+            for record in records[:15]
+        )[:4096]
+        traces = "\n\n".join(
+            f"[{record.fingerprint}] {record.source} x{record.count}\n{record.trace}"
+            for record in records
+        )
+        await interaction.response.send_message(
+            embed=embed,
+            file=discord.File(io.BytesIO(traces.encode()), filename="errors.txt"),
+            ephemeral=True,
+        )
+
     async def test_broadcast(self, interaction: discord.Interaction):
         class TestBroadcastView(View):
             def __init__(self):
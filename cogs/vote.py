@@ -1,9 +1,9 @@
 import os
-import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
+from utils.http import get_http_session
 
 
 class Vote(commands.Cog):
@@ -22,39 +22,38 @@ class Vote(commands.Cog):
         vote_url = f"https://top.gg/bot/{bot_id}/vote"
         headers = {"Authorization": self.top_gg_api_token}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://top.gg/api/bots/{bot_id}/check?userId={user_id}",
-                headers=headers,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    has_voted = data.get("voted", 0)
-                    if has_voted:
-                        embed = discord.Embed(
-                            title="You've voted in last 12 hours! 🎉",
-                            description=f"Thank you, your support means so much, {interaction.user.mention}!",
-                            color=discord.Color.green(),
-                        )
-                        embed.set_footer(text="Voting helps the bot grow and stay up to date!")
-                    else:
-                        embed = discord.Embed(
-                            title="You Haven't Voted Yet!",
-                            description=f"{interaction.user.mention}, you can vote for the bot [here]({vote_url}).",
-                            color=discord.Color.red(),
-                        )
-                        embed.set_footer(
-                            text="Voting helps the bot grow!"
-                        )
+        async with get_http_session(self.bot).get(
+            f"https://top.gg/api/bots/{bot_id}/check?userId={user_id}",
+            headers=headers,
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                has_voted = data.get("voted", 0)
+                if has_voted:
+                    embed = discord.Embed(
+                        title="You've voted in last 12 hours! 🎉",
+                        description=f"Thank you, your support means so much, {interaction.user.mention}!",
+                        color=discord.Color.green(),
+                    )
+                    embed.set_footer(text="Voting helps the bot grow and stay up to date!")
                 else:
                     embed = discord.Embed(
-                        title="Error Checking Vote Status",
-                        description="Sorry, I couldn't check your vote status. Please try again later.",
-                        color=discord.Color.orange(),
+                        title="You Haven't Voted Yet!",
+                        description=f"{interaction.user.mention}, you can vote for the bot [here]({vote_url}).",
+                        color=discord.Color.red(),
                     )
-                    embed.set_footer(text=f"Error Code: {response.status}")
-
-                await interaction.followup.send(embed=embed, ephemeral=True)
+                    embed.set_footer(
+                        text="Voting helps the bot grow!"
+                    )
+            else:
+                embed = discord.Embed(
+                    title="Error Checking Vote Status",
+                    description="Sorry, I couldn't check your vote status. Please try again later.",
+                    color=discord.Color.orange(),
+                )
+                embed.set_footer(text=f"Error Code: {response.status}")
+
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
 
 async def setup(bot):
@@ -0,0 +1,161 @@
+import asyncio
+import itertools
+import json
+import os
+import signal
+import sys
+import tempfile
+import aiohttp
+from dotenv import load_dotenv
+from utils.cluster import IPC_READ_LIMIT, IPC_TIMEOUT, encode_message, split_shards
+
+RESTART_SECONDS = 10
+
+load_dotenv()
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Responses(dict):
+    def __init__(self, expected: int):
+        super().__init__()
+        self.expected = expected
+        self.done = asyncio.Event()
+        if expected == 0:
+            self.done.set()
+
+
+class ClusterHub:
+    def __init__(self):
+        self.clusters = {}
+        self.pending = {}
+        self.call_ids = itertools.count()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        cluster_id = None
+        try:
+            while line := await reader.readline():
+                message = json.loads(line)
+                if message["op"] == "identify":
+                    cluster_id = message["cluster"]
+                    self.clusters[cluster_id] = writer
+                elif message["op"] == "request":
+                    asyncio.create_task(self.fan_out(writer, message))
+                elif message["op"] == "response":
+                    responses = self.pending.get(message["id"])
+                    if responses is not None:
+                        responses[message["cluster"]] = message["result"]
+                        if len(responses) >= responses.expected:
+                            responses.done.set()
+        except (OSError, ValueError) as e:
+            print(f"Cluster {cluster_id} connection failed: {e}")
+        finally:
+            if cluster_id is not None and self.clusters.get(cluster_id) is writer:
+                del self.clusters[cluster_id]
+            writer.close()
+
+    async def fan_out(self, requester: asyncio.StreamWriter, message: dict):
+        call_id = next(self.call_ids)
+        targets = list(self.clusters.values())
+        responses = self.pending[call_id] = Responses(len(targets))
+        call = encode_message(
+            {
+                "op": "call",
+                "id": call_id,
+                "method": message["method"],
+                "args": message.get("args", {}),
+            }
+        )
+        for writer in targets:
+            writer.write(call)
+
+        try:
+            await asyncio.wait_for(
+                responses.done.wait(), message.get("timeout", IPC_TIMEOUT)
+            )
+        except asyncio.TimeoutError:
+            missing = sorted(set(self.clusters) - set(responses))
+            print(f"Clusters {missing} did not answer {message['method']} in time.")
+        finally:
+            del self.pending[call_id]
+
+        results = [responses[cluster_id] for cluster_id in sorted(responses)]
+        if not requester.is_closing():
+            requester.write(
+                encode_message({"op": "reply", "id": message["id"], "results": results})
+            )
+
+
+async def recommended_shard_count():
+    headers = {"Authorization": f"Bot {os.getenv('TOKEN')}"}
+    async with aiohttp.ClientSession() as session:
+        async with session.get("https://discord.com/api/v10/gateway/bot", headers=headers) as response:
+            response.raise_for_status()
+            return (await response.json())["shards"]
+
+
+async def run_cluster(cluster_id: int, shard_ids, shard_count: int, cluster_count: int, socket_path: str):
+    env = {
+        **os.environ,
+        "SHARD_COUNT": str(shard_count),
+        "SHARD_IDS": ",".join(map(str, shard_ids)),
+        "CLUSTER_ID": str(cluster_id),
+        "CLUSTER_COUNT": str(cluster_count),
+        "CLUSTER_SOCKET": socket_path,
+    }
+    while True:
+        print(f"Starting cluster {cluster_id} with shards {shard_ids[0]}-{shard_ids[-1]}.")
+        process = await asyncio.create_subprocess_exec(sys.executable, "main.py", env=env)
+        try:
+            code = await process.wait()
+        except asyncio.CancelledError:
+            if process.returncode is None:
+                process.terminate()
+                await process.wait()
+            raise
+        print(f"Cluster {cluster_id} exited with code {code}. Restarting in {RESTART_SECONDS}s.")
+        await asyncio.sleep(RESTART_SECONDS)
+
+
+async def main():
+    try:
+        cluster_count = int(os.getenv("CLUSTER_COUNT", str(os.cpu_count() or 1)))
+        shard_count = int(os.getenv("SHARD_COUNT", "0")) or await recommended_shard_count()
+    except ValueError:
+        print("Invalid CLUSTER_COUNT or SHARD_COUNT value. Ensure they are whole numbers.")
+        return
+    except aiohttp.ClientError as e:
+        print(f"Failed to fetch the recommended shard count: {e}")
+        return
+
+    cluster_count = max(1, min(cluster_count, shard_count))
+    socket_path = os.getenv(
+        "CLUSTER_SOCKET", os.path.join(tempfile.gettempdir(), "paul-clusters.sock")
+    )
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    hub = ClusterHub()
+    server = await asyncio.start_unix_server(hub.handle, socket_path, limit=IPC_READ_LIMIT)
+    print(f"Launching {cluster_count} cluster(s) for {shard_count} shard(s).")
+
+    tasks = [
+        asyncio.create_task(run_cluster(cluster_id, shard_ids, shard_count, cluster_count, socket_path))
+        for cluster_id, shard_ids in enumerate(split_shards(shard_count, cluster_count))
+    ]
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await stop.wait()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    server.close()
+    await server.wait_closed()
+    os.remove(socket_path)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,27 +1,53 @@
+from utils.startup import StartupTimer
+
+startup_timer = StartupTimer()
+
 import asyncio
 import os
 import traceback
 import platform
 import datetime
-import aiohttp
 from dotenv import load_dotenv
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 from discord.app_commands import CommandOnCooldown
+from utils.cluster import get_cluster
+from utils.http import create_http_session, get_http_session
+from utils.errors import get_error_sink
+from utils.stats import get_stats
+from utils.treesync import sync_tree
+
+startup_timer.phase("Imports")
 
 VERSION = "v9.1"
 STATUS = "ronenlaz.com"
+EXTENSIONS = [
+    "cogs.restricted",
+    "cogs.moderation",
+    "cogs.misc",
+    "cogs.fun",
+    "cogs.feedback",
+    "cogs.modmail",
+    "cogs.automod",
+    "cogs.help",
+    "cogs.vote",
+    "cogs.clash",
+    "cogs.autorole",
+]
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
-client = commands.Bot(command_prefix="x!", intents=intents, help_command=None)
-
 load_dotenv()
 LOG_CHANNEL = os.getenv("LOG_CHANNEL")
 TOP_GG_API_TOKEN = os.getenv("TOP_GG_API_TOKEN")
 TWITCH_URL = os.getenv("TWITCH_URL", "https://twitch.tv/romi330")
+AUTO_SHARD = os.getenv("AUTO_SHARD", "false").lower() in ("1", "true", "yes")
+SHARD_COUNT = os.getenv("SHARD_COUNT")
+SHARD_IDS = os.getenv("SHARD_IDS")
+LEAN_MEMBER_CACHE = os.getenv("LEAN_MEMBER_CACHE", "false").lower() in ("1", "true", "yes")
+MAX_MESSAGES = os.getenv("MAX_MESSAGES", "100")
 
 if not TOP_GG_API_TOKEN:
     raise ValueError("TOP_GG_API_TOKEN is missing. Please set it in the environment variables.")
@@ -32,14 +58,119 @@ except ValueError:
     LOG_CHANNEL = None
     print("Invalid LOG_CHANNEL value. Ensure it is a valid channel ID.")
 
+try:
+    SHARD_COUNT = int(SHARD_COUNT) if SHARD_COUNT else None
+except ValueError:
+    SHARD_COUNT = None
+    print("Invalid SHARD_COUNT value. Letting Discord pick the shard count.")
+
+try:
+    SHARD_IDS = [int(shard_id) for shard_id in SHARD_IDS.split(",")] if SHARD_IDS else None
+except ValueError:
+    SHARD_IDS = None
+    print("Invalid SHARD_IDS value. Ensure it is a comma-separated list of shard IDs.")
+
+if SHARD_IDS is not None and SHARD_COUNT is None:
+    SHARD_IDS = None
+    print("SHARD_IDS requires SHARD_COUNT. Running every shard instead.")
+
+SHARDED = AUTO_SHARD or SHARD_COUNT is not None
+
+try:
+    MAX_MESSAGES = int(MAX_MESSAGES)
+except ValueError:
+    MAX_MESSAGES = 100
+    print("Invalid MAX_MESSAGES value. Ensure it is a whole number.")
+
+
+class Bot(commands.AutoShardedBot if SHARDED else commands.Bot):
+    http_session = None
+    synced_commands = None
+
+    async def login(self, token: str):
+        startup_timer.phase("Startup")
+        await super().login(token)
+
+    async def setup_hook(self):
+        startup_timer.phase("Login")
+        self.http_session = create_http_session()
+        get_cluster(self).start()
+        get_stats(self).start()
+        get_error_sink(self).start(LOG_CHANNEL)
+
+        results = await asyncio.gather(
+            *(self.load_extension(extension) for extension in EXTENSIONS),
+            return_exceptions=True,
+        )
+        for extension, result in zip(EXTENSIONS, results):
+            if isinstance(result, Exception):
+                print(f"Failed to load extension {extension}: {result}")
+                traceback.print_exception(type(result), result, result.__traceback__)
+        startup_timer.phase("Cog loads")
+
+        if get_cluster(self).cluster_id == 0:
+            try:
+                synced = await sync_tree(self)
+            except discord.HTTPException as e:
+                print(f"Failed to sync application commands: {e}")
+            else:
+                if synced is None:
+                    print("Application commands unchanged, skipping sync.")
+                else:
+                    print(f"Synced {len(synced)} application command(s)")
+                    self.synced_commands = len(synced)
+        startup_timer.phase("Tree sync")
+
+    async def close(self):
+        await get_error_sink(self).close()
+        await super().close()
+        await get_cluster(self).close()
+        get_stats(self).close()
+        if self.http_session is not None:
+            await self.http_session.close()
+
+
+shard_options = {"shard_count": SHARD_COUNT, "shard_ids": SHARD_IDS} if SHARDED else {}
+cache_options = (
+    {
+        "chunk_guilds_at_startup": False,
+        "member_cache_flags": discord.MemberCacheFlags.none(),
+        "max_messages": MAX_MESSAGES,
+    }
+    if LEAN_MEMBER_CACHE
+    else {}
+)
+client = Bot(command_prefix="x!", intents=intents, help_command=None, **shard_options, **cache_options)
+
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
 async def post_server_count():
     url = f"https://top.gg/api/bots/{client.user.id}/stats"
     headers = {"Authorization": TOP_GG_API_TOKEN, "Content-Type": "application/json"}
-    payload = {"server_count": len(client.guilds)}
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=payload) as response:
+    cluster = get_cluster(client)
+    if cluster.enabled:
+        if cluster.cluster_id != 0:
+            return
+        stats = await cluster.gather("stats")
+        payloads = [
+            {
+                "server_count": sum(cluster_stats["guilds"] for cluster_stats in stats),
+                "shard_count": client.shard_count,
+            }
+        ]
+    elif SHARD_IDS is not None:
+        shard_guilds = get_stats(client).shard_guilds
+        payloads = [
+            {"server_count": shard_guilds[shard_id], "shard_id": shard_id, "shard_count": client.shard_count}
+            for shard_id in client.shards
+        ]
+    else:
+        payloads = [{"server_count": get_stats(client).guilds}]
+        if client.shard_count:
+            payloads[0]["shard_count"] = client.shard_count
+
+    for payload in payloads:
+        async with get_http_session(client).post(url, headers=headers, json=payload) as response:
             if response.status != 200:
                 print(f"Failed to post server count to Top.gg. Status: {response.status}")
                 print(await response.text())
@@ -50,8 +181,13 @@ async def on_ready():
         client.start_time = datetime.datetime.now(datetime.timezone.utc)
         client.loop.create_task(post_server_count_periodically())
         print("Current working directory:", os.getcwd())
-        synced = await client.tree.sync()
-        print(f"Synced {len(synced)} application command(s)")
+        if not startup_timer.finished:
+            startup_timer.phase("READY")
+            time_to_ready = startup_timer.finish()
+            print("\nStartup Timing:")
+            print(startup_timer.report())
+        else:
+            time_to_ready = None
 
         print("Bot Information:")
         print(f"  Name: {client.user.name}")
@@ -60,10 +196,14 @@ async def on_ready():
         print(f"  Bot Version: {VERSION}")
 
         print("\nServer Statistics:")
-        total_servers = len(client.guilds)
-        total_users = sum(guild.member_count for guild in client.guilds)
+        stats = get_stats(client)
+        stats.reconcile()
+        total_servers = stats.guilds
+        total_users = stats.users
         print(f"  Total Servers: {total_servers}")
         print(f"  Total Users: {total_users}")
+        if client.shard_count:
+            print(f"  Shards: {len(client.shards)} of {client.shard_count}")
         print("\nBot is ready and operational!")
         log_channel_obj = client.get_channel(LOG_CHANNEL)
         if log_channel_obj:
@@ -71,9 +211,15 @@ async def on_ready():
             startup_embed.add_field(name="Bot Version", value=VERSION, inline=False)
             startup_embed.add_field(name="Total Servers", value=total_servers, inline=True)
             startup_embed.add_field(name="Total Users", value=total_users, inline=True)
-            startup_embed.add_field(name="Synced Commands", value=len(synced), inline=True)
+            startup_embed.add_field(
+                name="Synced Commands",
+                value=client.synced_commands if client.synced_commands is not None else "Unchanged",
+                inline=True,
+            )
             startup_embed.add_field(name="Python Version", value=platform.python_version(), inline=True)
             startup_embed.add_field(name="Discord.py Version", value=discord.__version__, inline=True)
+            if time_to_ready is not None:
+                startup_embed.add_field(name="Startup Time", value=f"{time_to_ready:.2f}s", inline=True)
             await log_channel_obj.send(embed=startup_embed)
         else:
             print("Log channel not found or invalid LOG_CHANNEL value. Skipping log message.")
@@ -125,12 +271,8 @@ async def on_app_command_error(interaction: discord.Interaction, exception: app_
             except discord.HTTPException:
                 pass
     if not isinstance(exception, (commands.BadArgument, commands.MissingRequiredArgument, app_commands.BotMissingPermissions, app_commands.MissingPermissions, CommandOnCooldown)):
-        log_channel_obj = client.get_channel(LOG_CHANNEL)
-        if log_channel_obj:
-            error_trace = "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
-            if len(error_trace) > 2000:
-                error_trace = error_trace[:1997] + "..."
-            await log_channel_obj.send(f"**Error**: {exception}\n```python\n{error_trace}```")
+        command = interaction.command.qualified_name if interaction.command else "unknown"
+        get_error_sink(client).report(exception, f"/{command}")
 
 @client.event
 async def on_command_error(ctx: commands.Context, exception: commands.CommandError):
@@ -175,21 +317,7 @@ async def on_command_error(ctx: commands.Context, exception: commands.CommandErr
         ),
     ):
         if isinstance(exception, (commands.CommandInvokeError, commands.CommandError)):
-            log_channel_obj = client.get_channel(LOG_CHANNEL)
-            if log_channel_obj:
-                error_trace = "".join(
-                    traceback.format_exception(
-                        type(exception), exception, exception.__traceback__
-                    )
-                )
-                if len(error_trace) > 2000:
-                    error_trace = error_trace[:1997] + "..."
-                await log_channel_obj.send(
-                    f"**Error in `{ctx.command}`**: {exception}\n```python\n{error_trace}```"
-                )
+            get_error_sink(client).report(exception, f"x!{ctx.command}")
 
 if __name__ == "__main__":
-    extensions = ["cogs.restricted", "cogs.moderation", "cogs.misc", "cogs.fun", "cogs.feedback", "cogs.modmail", "cogs.automod", "cogs.help", "cogs.vote", "cogs.clash", "cogs.autorole"]
-    for ext in extensions:
-        asyncio.run(client.load_extension(ext))
     client.run(os.getenv("TOKEN"))
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.metrics import CheckMetrics
+from utils.ruleengine import AutoModEngine, MessageRecord
+
+MAX_BATCH_SIZE = 256
+
+_engine = None
+
+
+def _init_worker():
+    global _engine
+    _engine = AutoModEngine({})
+
+
+def _evaluate_batch(updates: dict, records: list):
+    for guild_id, rules in updates.items():
+        if rules is None:
+            _engine.rules.pop(guild_id, None)
+        else:
+            _engine.rules[guild_id] = json.loads(rules)
+        _engine.compile_rules(guild_id)
+
+    _engine.evict_expired(time.monotonic())
+    verdicts = []
+    for record in records:
+        reason = _engine.evaluate(record)
+        verdicts.append((reason, _engine.take_related_messages()))
+    return verdicts, _engine.metrics.drain()
+
+
+class Partition:
+    def __init__(self, context, metrics: CheckMetrics):
+        self.context = context
+        self.metrics = metrics
+        self.executor = None
+        self.versions = {}
+        self.snapshots = {}
+        self.pending = []
+        self.task = None
+
+    def start(self):
+        self.executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=self.context, initializer=_init_worker
+        )
+        self.versions.clear()
+
+    def submit(self, record: MessageRecord, rules: dict, version: int):
+        future = asyncio.get_running_loop().create_future()
+        guild_id = str(record.guild_id)
+        snapshot = self.snapshots.get(guild_id)
+        if snapshot is None or snapshot[0] != version:
+            snapshot = self.snapshots[guild_id] = (
+                version,
+                None if rules is None else json.dumps(rules),
+            )
+        self.pending.append((record, snapshot[1], version, future))
+        if self.task is None:
+            self.task = asyncio.create_task(self.drain())
+        return future
+
+    async def drain(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while self.pending:
+                jobs = self.pending[:MAX_BATCH_SIZE]
+                del self.pending[:MAX_BATCH_SIZE]
+
+                updates = {}
+                for record, rules, version, _ in jobs:
+                    guild_id = str(record.guild_id)
+                    if self.versions.get(guild_id) != version:
+                        updates[guild_id] = rules
+                        self.versions[guild_id] = version
+
+                records = [record for record, _, _, _ in jobs]
+                try:
+                    verdicts, snapshot = await loop.run_in_executor(
+                        self.executor, _evaluate_batch, updates, records
+                    )
+                    self.metrics.merge(snapshot)
+                except BrokenProcessPool:
+                    print("AutoMod worker process died, restarting it.")
+                    self.executor.shutdown(wait=False, cancel_futures=True)
+                    self.start()
+                    verdicts = [(None, [])] * len(jobs)
+                except Exception as e:
+                    print(f"AutoMod worker failed to evaluate a batch: {e}")
+                    self.versions.clear()
+                    verdicts = [(None, [])] * len(jobs)
+
+                for (_, _, _, future), verdict in zip(jobs, verdicts):
+                    if not future.done():
+                        future.set_result(verdict)
+        finally:
+            self.task = None
+
+    def shutdown(self):
+        if self.task is not None:
+            self.task.cancel()
+        for _, _, _, future in self.pending:
+            future.cancel()
+        self.pending.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class EvaluationPool:
+    def __init__(self, workers: int, metrics: CheckMetrics):
+        context = multiprocessing.get_context("spawn")
+        self.partitions = [Partition(context, metrics) for _ in range(workers)]
+        for partition in self.partitions:
+            partition.start()
+
+    def __len__(self):
+        return len(self.partitions)
+
+    def submit(self, record: MessageRecord, rules: dict, version: int):
+        partition = self.partitions[record.guild_id % len(self.partitions)]
+        return partition.submit(record, rules, version)
+
+    def shutdown(self):
+        for partition in self.partitions:
+            partition.shutdown()
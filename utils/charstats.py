@@ -0,0 +1,138 @@
+import re
+import unicodedata
+
+CUSTOM_EMOJI_PATTERN = re.compile(r"<a?:\w+:\d+>")
+
+ZERO_WIDTH_JOINER = 0x200D
+KEYCAP = 0x20E3
+
+EMOJI_RANGES = (
+    (0x231A, 0x231B),
+    (0x23E9, 0x23FA),
+    (0x2600, 0x27BF),
+    (0x2B05, 0x2B07),
+    (0x2B1B, 0x2B1C),
+    (0x2B50, 0x2B55),
+    (0x1F000, 0x1F0FF),
+    (0x1F10D, 0x1F1FF),
+    (0x1F200, 0x1F2FF),
+    (0x1F300, 0x1F3FA),
+    (0x1F400, 0x1FAFF),
+)
+SKIN_TONES = (0x1F3FB, 0x1F3FF)
+REGIONAL_INDICATORS = (0x1F1E6, 0x1F1FF)
+
+
+def is_emoji(codepoint: int):
+    if codepoint < 0x231A:
+        return False
+    for start, end in EMOJI_RANGES:
+        if codepoint < start:
+            return False
+        if codepoint <= end:
+            return True
+    return False
+
+
+class CharStats:
+    __slots__ = ("length", "emoji", "letters", "uppercase", "newlines", "combining")
+
+    def __init__(self, length: int):
+        self.length = length
+        self.emoji = 0
+        self.letters = 0
+        self.uppercase = 0
+        self.newlines = 0
+        self.combining = 0
+
+
+def scan_characters(
+    content: str,
+    emoji_limit: int = None,
+    newline_limit: int = None,
+    combining_percent: int = None,
+):
+    stats = CharStats(len(content))
+
+    if content.isascii():
+        stats.newlines = content.count("\n")
+        if "<" in content:
+            stats.emoji = len(CUSTOM_EMOJI_PATTERN.findall(content))
+            content = CUSTOM_EMOJI_PATTERN.sub("", content)
+        stats.letters = sum(map(str.isalpha, content))
+        stats.uppercase = sum(map(str.isupper, content))
+        return stats
+
+    emoji_limit = float("inf") if emoji_limit is None else emoji_limit
+    newline_limit = float("inf") if newline_limit is None else newline_limit
+    combining_limit = (
+        float("inf")
+        if combining_percent is None
+        else combining_percent * stats.length / 100
+    )
+    combining = unicodedata.combining
+
+    emoji = letters = uppercase = newlines = marks = 0
+    after_joiner = False
+    pending_flag = False
+    index = 0
+    length = len(content)
+    while index < length:
+        char = content[index]
+        codepoint = ord(char)
+        index += 1
+
+        if codepoint < 0x80:
+            if char == "\n":
+                newlines += 1
+                if newlines > newline_limit:
+                    break
+            elif char == "<":
+                match = CUSTOM_EMOJI_PATTERN.match(content, index - 1)
+                if match:
+                    index = match.end()
+                    emoji += 1
+                    if emoji > emoji_limit:
+                        break
+            elif char.isalpha():
+                letters += 1
+                if char.isupper():
+                    uppercase += 1
+            after_joiner = False
+            continue
+
+        if codepoint == ZERO_WIDTH_JOINER:
+            after_joiner = True
+            continue
+
+        if combining(char):
+            marks += 1
+            if marks > combining_limit:
+                break
+            continue
+
+        if REGIONAL_INDICATORS[0] <= codepoint <= REGIONAL_INDICATORS[1]:
+            pending_flag = not pending_flag
+            if not pending_flag:
+                after_joiner = False
+                continue
+        elif SKIN_TONES[0] <= codepoint <= SKIN_TONES[1]:
+            continue
+
+        if codepoint == KEYCAP or is_emoji(codepoint):
+            if not after_joiner:
+                emoji += 1
+                if emoji > emoji_limit:
+                    break
+        elif char.isalpha():
+            letters += 1
+            if char.isupper():
+                uppercase += 1
+        after_joiner = False
+
+    stats.emoji = emoji
+    stats.letters = letters
+    stats.uppercase = uppercase
+    stats.newlines = newlines
+    stats.combining = marks
+    return stats
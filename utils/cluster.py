@@ -0,0 +1,151 @@
+import asyncio
+import itertools
+import json
+import os
+from utils.stats import get_stats
+
+IPC_READ_LIMIT = 16 * 1024 * 1024
+IPC_TIMEOUT = 10
+RECONNECT_SECONDS = 5
+
+
+def encode_message(message: dict):
+    return (json.dumps(message) + "\n").encode()
+
+
+def split_shards(shard_count: int, clusters: int):
+    per_cluster, extra = divmod(shard_count, clusters)
+    ranges = []
+    start = 0
+    for cluster_id in range(clusters):
+        size = per_cluster + (1 if cluster_id < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return ranges
+
+
+class ClusterClient:
+    def __init__(self, bot):
+        self.bot = bot
+        self.cluster_id = int(os.getenv("CLUSTER_ID", "0"))
+        self.socket_path = os.getenv("CLUSTER_SOCKET")
+        self.handlers = {"stats": self.local_stats, "servers": self.local_servers}
+        self.pending = {}
+        self.request_ids = itertools.count()
+        self.writer = None
+        self.task = None
+
+    @property
+    def enabled(self):
+        return self.socket_path is not None
+
+    def start(self):
+        if self.enabled and self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    async def close(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    async def run(self):
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    self.socket_path, limit=IPC_READ_LIMIT
+                )
+            except OSError as e:
+                print(f"Cluster {self.cluster_id} could not reach the launcher: {e}")
+                await asyncio.sleep(RECONNECT_SECONDS)
+                continue
+
+            self.writer = writer
+            writer.write(encode_message({"op": "identify", "cluster": self.cluster_id}))
+            try:
+                while line := await reader.readline():
+                    message = json.loads(line)
+                    if message["op"] == "call":
+                        asyncio.create_task(self.answer(message))
+                    elif message["op"] == "reply":
+                        future = self.pending.pop(message["id"], None)
+                        if future is not None and not future.done():
+                            future.set_result(message["results"])
+            except (OSError, ValueError) as e:
+                print(f"Cluster {self.cluster_id} lost the launcher connection: {e}")
+            finally:
+                self.writer = None
+                writer.close()
+                for future in self.pending.values():
+                    if not future.done():
+                        future.set_exception(ConnectionError("Launcher connection lost."))
+                self.pending.clear()
+            await asyncio.sleep(RECONNECT_SECONDS)
+
+    async def answer(self, message: dict):
+        handler = self.handlers.get(message["method"])
+        try:
+            result = await handler(**message.get("args", {})) if handler else None
+        except Exception as e:
+            print(f"Cluster handler {message['method']} failed: {e}")
+            result = None
+        if self.writer is not None:
+            self.writer.write(
+                encode_message(
+                    {
+                        "op": "response",
+                        "id": message["id"],
+                        "cluster": self.cluster_id,
+                        "result": result,
+                    }
+                )
+            )
+
+    async def gather(self, method: str, timeout: float = IPC_TIMEOUT, **args):
+        if self.writer is None:
+            return [await self.handlers[method](**args)]
+
+        request_id = next(self.request_ids)
+        future = self.pending[request_id] = asyncio.get_running_loop().create_future()
+        self.writer.write(
+            encode_message(
+                {
+                    "op": "request",
+                    "id": request_id,
+                    "method": method,
+                    "args": args,
+                    "timeout": timeout,
+                }
+            )
+        )
+        try:
+            results = await asyncio.wait_for(future, timeout + RECONNECT_SECONDS)
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            self.pending.pop(request_id, None)
+            print(f"Cluster request {method} failed: {e!r}")
+            return []
+        return [result for result in results if result is not None]
+
+    async def local_stats(self):
+        import psutil
+
+        stats = get_stats(self.bot)
+        return {
+            "cluster": self.cluster_id,
+            "guilds": stats.guilds,
+            "users": stats.users,
+            "memory": psutil.Process(os.getpid()).memory_info().rss,
+            "shards": sorted(self.bot.shards) if self.bot.shard_count else [0],
+        }
+
+    async def local_servers(self):
+        return [[guild.name, guild.id] for guild in self.bot.guilds]
+
+
+def get_cluster(bot):
+    cluster = getattr(bot, "cluster", None)
+    if cluster is None:
+        cluster = bot.cluster = ClusterClient(bot)
+    return cluster
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+CONFIG_DB = "bot_config.db"
+
+
+class ConfigStore:
+    def __init__(self, path: str = CONFIG_DB):
+        self.path = path
+        self._cache = {}
+        self._connection = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="config-store"
+        )
+
+    def open(self):
+        if self._connection is None:
+            self._executor.submit(self._open).result()
+
+    def _open(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS guild_config ("
+            "namespace TEXT NOT NULL, guild_id TEXT NOT NULL, data TEXT NOT NULL, "
+            "PRIMARY KEY (namespace, guild_id))"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS imported_files ("
+            "namespace TEXT PRIMARY KEY, path TEXT NOT NULL)"
+        )
+        connection.commit()
+
+        for namespace, guild_id, data in connection.execute(
+            "SELECT namespace, guild_id, data FROM guild_config"
+        ):
+            self._cache.setdefault(namespace, {})[guild_id] = json.loads(data)
+        self._connection = connection
+
+    def import_json(self, namespace: str, path: str):
+        self.open()
+        self._executor.submit(self._import_json, namespace, path).result()
+
+    def _import_json(self, namespace: str, path: str):
+        connection = self._connection
+        if connection.execute(
+            "SELECT 1 FROM imported_files WHERE namespace = ?", (namespace,)
+        ).fetchone():
+            return
+
+        data = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Failed to import {path}: {e}")
+                return
+
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO guild_config (namespace, guild_id, data) "
+                "VALUES (?, ?, ?)",
+                [
+                    (namespace, str(guild_id), json.dumps(value))
+                    for guild_id, value in data.items()
+                ],
+            )
+            connection.execute(
+                "INSERT INTO imported_files (namespace, path) VALUES (?, ?)",
+                (namespace, path),
+            )
+
+        guilds = self.namespace(namespace)
+        for guild_id, value in data.items():
+            guilds[str(guild_id)] = value
+
+    def namespace(self, namespace: str):
+        return self._cache.setdefault(namespace, {})
+
+    def get(self, namespace: str, guild_id, default=None):
+        return self.namespace(namespace).get(str(guild_id), default)
+
+    async def set(self, namespace: str, guild_id, value):
+        self.namespace(namespace)[str(guild_id)] = value
+        await self.save(namespace, guild_id)
+
+    async def save(self, namespace: str, guild_id):
+        guild_id = str(guild_id)
+        value = self.namespace(namespace).get(guild_id)
+        if value is None:
+            await self._run(self._write, [], [(namespace, guild_id)])
+        else:
+            await self._run(
+                self._write, [(namespace, guild_id, json.dumps(value))], []
+            )
+
+    async def save_all(self, namespace: str):
+        rows = [
+            (namespace, guild_id, json.dumps(value))
+            for guild_id, value in self.namespace(namespace).items()
+        ]
+        await self._run(self._write, rows, [])
+
+    async def delete(self, namespace: str, guild_id):
+        self.namespace(namespace).pop(str(guild_id), None)
+        await self.save(namespace, guild_id)
+
+    def _write(self, upserts, deletes):
+        with self._connection as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO guild_config (namespace, guild_id, data) "
+                "VALUES (?, ?, ?)",
+                upserts,
+            )
+            connection.executemany(
+                "DELETE FROM guild_config WHERE namespace = ? AND guild_id = ?",
+                deletes,
+            )
+
+    async def _run(self, func, *args):
+        self.open()
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, func, *args)
+        except sqlite3.Error as e:
+            print(f"Failed to save configuration: {e}")
+
+    def close(self):
+        if self._connection is not None:
+            self._executor.submit(self._connection.close).result()
+            self._connection = None
+        self._executor.shutdown(wait=True)
+
+
+def get_config_store(bot):
+    store = getattr(bot, "config_store", None)
+    if store is None:
+        store = bot.config_store = ConfigStore()
+    store.open()
+    return store
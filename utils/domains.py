@@ -0,0 +1,42 @@
+import re
+
+_SCHEME = re.compile(r"^[a-z][a-z0-9+.-]*://", re.IGNORECASE)
+
+
+def normalize_domain(domain: str):
+    domain = _SCHEME.sub("", domain.strip().lower())
+    domain = re.split(r"[/?#:\s]", domain, maxsplit=1)[0]
+    return domain.lstrip("*.").rstrip(".")
+
+
+class DomainPolicy:
+    __slots__ = ("block_by_default", "_root")
+
+    def __init__(self, allowed=(), blocked=(), block_by_default: bool = True):
+        self.block_by_default = block_by_default
+        self._root = {}
+        for domain in allowed:
+            self._insert(domain, False)
+        for domain in blocked:
+            self._insert(domain, True)
+
+    def _insert(self, domain: str, blocked: bool):
+        domain = normalize_domain(domain)
+        if not domain:
+            return
+        node = self._root
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[None] = blocked
+
+    def is_blocked(self, host: str):
+        if not host:
+            return self.block_by_default
+        verdict = self.block_by_default
+        node = self._root
+        for label in reversed(host.rstrip(".").split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            verdict = node.get(None, verdict)
+        return verdict
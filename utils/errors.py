@@ -0,0 +1,147 @@
+import asyncio
+import hashlib
+import time
+import traceback
+from collections import OrderedDict
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+ERROR_FLUSH_SECONDS = 60
+ERROR_RING_SIZE = 50
+DIGEST_FIELDS = 5
+TRACE_LENGTH = 800
+
+
+def unwrap(exception: BaseException):
+    while isinstance(exception, (app_commands.CommandInvokeError, commands.CommandInvokeError)):
+        exception = exception.original
+    return exception
+
+
+def fingerprint(exception: BaseException):
+    exception = unwrap(exception)
+    parts = [f"{type(exception).__module__}.{type(exception).__qualname__}"]
+    parts.extend(
+        f"{frame.filename}:{frame.name}:{frame.lineno}"
+        for frame in traceback.extract_tb(exception.__traceback__)
+    )
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:12]
+
+
+class ErrorRecord:
+    __slots__ = (
+        "fingerprint",
+        "kind",
+        "message",
+        "trace",
+        "source",
+        "count",
+        "pending",
+        "first_seen",
+        "last_seen",
+    )
+
+    def __init__(self, key: str, exception: BaseException, source: str):
+        self.fingerprint = key
+        self.kind = type(exception).__name__
+        self.message = str(exception)
+        self.trace = "".join(
+            traceback.format_exception(type(exception), exception, exception.__traceback__)
+        )
+        self.source = source
+        self.count = 0
+        self.pending = 0
+        self.first_seen = time.time()
+        self.last_seen = self.first_seen
+
+
+class ErrorSink:
+    def __init__(self, bot, size: int = ERROR_RING_SIZE):
+        self.bot = bot
+        self.size = size
+        self.channel_id = None
+        self.records = OrderedDict()
+        self.task = None
+
+    def start(self, channel_id: int, interval: float = ERROR_FLUSH_SECONDS):
+        self.channel_id = channel_id
+        if self.task is None:
+            self.task = asyncio.create_task(self.flush_periodically(interval))
+
+    async def close(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        await self.flush()
+
+    def report(self, exception: BaseException, source: str = None):
+        exception = unwrap(exception)
+        key = fingerprint(exception)
+        record = self.records.get(key)
+        if record is None:
+            record = self.records[key] = ErrorRecord(key, exception, source)
+            print(f"New error {key} in {source}: {record.kind}: {record.message}")
+            while len(self.records) > self.size:
+                self.records.popitem(last=False)
+        else:
+            self.records.move_to_end(key)
+            record.last_seen = time.time()
+            record.message = str(exception)
+        record.count += 1
+        record.pending += 1
+        return record
+
+    def recent(self):
+        return list(reversed(self.records.values()))
+
+    def digest(self, records):
+        embed = discord.Embed(
+            title="Error Digest",
+            description=f"{sum(record.pending for record in records)} error(s) "
+            f"across {len(records)} fingerprint(s) since the last digest.",
+            color=discord.Color.red(),
+        )
+        for record in records[:DIGEST_FIELDS]:
+            trace = record.trace[-TRACE_LENGTH:]
+            embed.add_field(
+                name=f"{record.kind} in {record.source} x{record.pending}"[:256],
+                value=f"`{record.fingerprint}` {record.message[:80]}\n```python\n{trace}```",
+                inline=False,
+            )
+        hidden = len(records) - DIGEST_FIELDS
+        if hidden > 0:
+            embed.set_footer(text=f"...and {hidden} more. See Recent Errors in the dev dashboard.")
+        return embed
+
+    async def flush(self):
+        records = sorted(
+            (record for record in self.records.values() if record.pending),
+            key=lambda record: record.pending,
+            reverse=True,
+        )
+        if not records:
+            return
+
+        log_channel = self.bot.get_channel(self.channel_id) if self.channel_id else None
+        if log_channel is not None:
+            try:
+                await log_channel.send(embed=self.digest(records))
+            except discord.HTTPException as e:
+                print(f"Failed to send error digest: {e}")
+                return
+        for record in records:
+            record.pending = 0
+
+    async def flush_periodically(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
+
+
+def get_error_sink(bot):
+    sink = getattr(bot, "error_sink", None)
+    if sink is None:
+        sink = bot.error_sink = ErrorSink(bot)
+    return sink
@@ -0,0 +1,23 @@
+import os
+
+
+class FileWatcher:
+    __slots__ = ("path", "signature")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.signature = self.stat()
+
+    def stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def changed(self):
+        signature = self.stat()
+        if signature == self.signature:
+            return False
+        self.signature = signature
+        return True
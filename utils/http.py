@@ -0,0 +1,24 @@
+import aiohttp
+
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5)
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTIONS_PER_HOST = 10
+DNS_CACHE_SECONDS = 300
+KEEPALIVE_SECONDS = 30
+
+
+def create_http_session():
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        limit_per_host=HTTP_CONNECTIONS_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_SECONDS,
+        keepalive_timeout=KEEPALIVE_SECONDS,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT)
+
+
+def get_http_session(bot):
+    session = getattr(bot, "http_session", None)
+    if session is None or session.closed:
+        session = bot.http_session = create_http_session()
+    return session
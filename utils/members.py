@@ -0,0 +1,49 @@
+import time
+from collections import OrderedDict
+
+import discord
+
+MEMBER_TTL = 300
+MEMBER_CACHE_SIZE = 1024
+
+
+class MemberCache:
+    def __init__(self, ttl: float = MEMBER_TTL, size: int = MEMBER_CACHE_SIZE):
+        self.ttl = ttl
+        self.size = size
+        self.members = OrderedDict()
+
+    def put(self, member: discord.Member):
+        key = (member.guild.id, member.id)
+        self.members[key] = (time.monotonic() + self.ttl, member)
+        self.members.move_to_end(key)
+        while len(self.members) > self.size:
+            self.members.popitem(last=False)
+
+    def cached(self, guild_id: int, user_id: int):
+        entry = self.members.get((guild_id, user_id))
+        if entry is None:
+            return None
+        expires, member = entry
+        if expires < time.monotonic():
+            del self.members[(guild_id, user_id)]
+            return None
+        return member
+
+    async def get(self, guild: discord.Guild, user_id: int):
+        member = guild.get_member(user_id) or self.cached(guild.id, user_id)
+        if member is not None:
+            return member
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            return None
+        self.put(member)
+        return member
+
+
+def get_member_cache(bot):
+    cache = getattr(bot, "member_cache", None)
+    if cache is None:
+        cache = bot.member_cache = MemberCache()
+    return cache
@@ -0,0 +1,187 @@
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (
+    0.000005,
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+)
+_BUCKET_BOUNDS_NS = tuple(int(bound * 1_000_000_000) for bound in LATENCY_BUCKETS)
+
+
+class CheckStats:
+    __slots__ = ("evaluations", "hits", "total_ns", "buckets")
+
+    def __init__(self):
+        self.evaluations = 0
+        self.hits = 0
+        self.total_ns = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(self, elapsed_ns: int, hit: bool):
+        self.evaluations += 1
+        if hit:
+            self.hits += 1
+        self.total_ns += elapsed_ns
+        self.buckets[bisect_left(_BUCKET_BOUNDS_NS, elapsed_ns)] += 1
+
+    def merge(self, evaluations: int, hits: int, total_ns: int, buckets):
+        self.evaluations += evaluations
+        self.hits += hits
+        self.total_ns += total_ns
+        for index, count in enumerate(buckets):
+            self.buckets[index] += count
+
+    def snapshot(self):
+        return (self.evaluations, self.hits, self.total_ns, tuple(self.buckets))
+
+    def quantile(self, fraction: float):
+        if not self.evaluations:
+            return 0.0
+        target = fraction * self.evaluations
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                break
+        if index < len(LATENCY_BUCKETS):
+            return LATENCY_BUCKETS[index]
+        return float("inf")
+
+
+class CheckMetrics:
+    def __init__(self):
+        self.totals = {}
+        self.guilds = {}
+
+    def observe(self, guild_id: int, check: str, elapsed_ns: int, hit: bool):
+        stats = self.totals.get(check)
+        if stats is None:
+            stats = self.totals[check] = CheckStats()
+        stats.observe(elapsed_ns, hit)
+
+        guild_stats = self.guilds.get(guild_id)
+        if guild_stats is None:
+            guild_stats = self.guilds[guild_id] = {}
+        stats = guild_stats.get(check)
+        if stats is None:
+            stats = guild_stats[check] = CheckStats()
+        stats.observe(elapsed_ns, hit)
+
+    def drain(self):
+        snapshot = [
+            (guild_id, check, *stats.snapshot())
+            for guild_id, guild_stats in self.guilds.items()
+            for check, stats in guild_stats.items()
+        ]
+        self.totals.clear()
+        self.guilds.clear()
+        return snapshot
+
+    def merge(self, snapshot):
+        for guild_id, check, evaluations, hits, total_ns, buckets in snapshot:
+            stats = self.totals.get(check)
+            if stats is None:
+                stats = self.totals[check] = CheckStats()
+            stats.merge(evaluations, hits, total_ns, buckets)
+
+            guild_stats = self.guilds.setdefault(guild_id, {})
+            stats = guild_stats.get(check)
+            if stats is None:
+                stats = guild_stats[check] = CheckStats()
+            stats.merge(evaluations, hits, total_ns, buckets)
+
+    def busiest_guilds(self, limit: int = 5):
+        return sorted(
+            (
+                (guild_id, sum(stats.total_ns for stats in guild_stats.values()))
+                for guild_id, guild_stats in self.guilds.items()
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:limit]
+
+    def render_prometheus(self):
+        lines = [
+            "# HELP automod_check_evaluations_total AutoMod check evaluations.",
+            "# TYPE automod_check_evaluations_total counter",
+        ]
+        for check, stats in self.totals.items():
+            lines.append(f'automod_check_evaluations_total{{check="{check}"}} {stats.evaluations}')
+
+        lines += [
+            "# HELP automod_check_hits_total Messages flagged by an AutoMod check.",
+            "# TYPE automod_check_hits_total counter",
+        ]
+        for check, stats in self.totals.items():
+            lines.append(f'automod_check_hits_total{{check="{check}"}} {stats.hits}')
+
+        lines += [
+            "# HELP automod_check_duration_seconds Time spent in an AutoMod check.",
+            "# TYPE automod_check_duration_seconds histogram",
+        ]
+        for check, stats in self.totals.items():
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                cumulative += count
+                lines.append(
+                    f'automod_check_duration_seconds_bucket{{check="{check}",le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f'automod_check_duration_seconds_bucket{{check="{check}",le="+Inf"}} {stats.evaluations}'
+            )
+            lines.append(
+                f'automod_check_duration_seconds_sum{{check="{check}"}} {stats.total_ns / 1_000_000_000}'
+            )
+            lines.append(
+                f'automod_check_duration_seconds_count{{check="{check}"}} {stats.evaluations}'
+            )
+
+        for name, help_text, field in (
+            ("automod_guild_check_evaluations_total", "AutoMod check evaluations per guild.", "evaluations"),
+            ("automod_guild_check_hits_total", "Messages flagged by an AutoMod check per guild.", "hits"),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for guild_id, guild_stats in self.guilds.items():
+                for check, stats in guild_stats.items():
+                    lines.append(
+                        f'{name}{{guild="{guild_id}",check="{check}"}} {getattr(stats, field)}'
+                    )
+
+        lines += [
+            "# HELP automod_guild_check_duration_seconds_total Time spent in an AutoMod check per guild.",
+            "# TYPE automod_guild_check_duration_seconds_total counter",
+        ]
+        for guild_id, guild_stats in self.guilds.items():
+            for check, stats in guild_stats.items():
+                lines.append(
+                    f'automod_guild_check_duration_seconds_total{{guild="{guild_id}",check="{check}"}} '
+                    f"{stats.total_ns / 1_000_000_000}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+async def start_metrics_server(metrics: CheckMetrics, host: str, port: int):
+    from aiohttp import web
+
+    async def handle(_: web.Request):
+        return web.Response(
+            body=metrics.render_prometheus().encode(),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
@@ -0,0 +1,73 @@
+import re
+
+from utils.charstats import scan_characters
+from utils.similarity import MessageFingerprint
+
+LINK_PATTERN = re.compile(
+    r"(?:https?://(?:[^\s/?#@]*@)?(?=\S)|(?=www\.))([\w.-]*)\S*", re.IGNORECASE
+)
+
+
+class NormalizedMessage:
+    __slots__ = (
+        "content",
+        "_lower",
+        "_tokens",
+        "_links",
+        "_hosts",
+        "_char_stats",
+        "_fingerprint",
+    )
+
+    def __init__(self, content: str):
+        self.content = content
+        self._lower = None
+        self._tokens = None
+        self._links = None
+        self._hosts = None
+        self._char_stats = None
+        self._fingerprint = None
+
+    @property
+    def lower(self):
+        if self._lower is None:
+            self._lower = self.content.lower()
+        return self._lower
+
+    @property
+    def tokens(self):
+        if self._tokens is None:
+            self._tokens = self.lower.split()
+        return self._tokens
+
+    def _scan_links(self):
+        self._links = []
+        self._hosts = []
+        for match in LINK_PATTERN.finditer(self.content):
+            self._links.append(match.span())
+            self._hosts.append(match.group(1).lower() or None)
+
+    @property
+    def links(self):
+        if self._links is None:
+            self._scan_links()
+        return self._links
+
+    @property
+    def hosts(self):
+        if self._hosts is None:
+            self._scan_links()
+        return self._hosts
+
+    def char_stats(self, emoji_limit=None, newline_limit=None, combining_percent=None):
+        if self._char_stats is None:
+            self._char_stats = scan_characters(
+                self.content, emoji_limit, newline_limit, combining_percent
+            )
+        return self._char_stats
+
+    @property
+    def fingerprint(self):
+        if self._fingerprint is None:
+            self._fingerprint = MessageFingerprint(self.content)
+        return self._fingerprint
@@ -0,0 +1,118 @@
+import re
+from functools import lru_cache
+
+from better_profanity.constants import ALLOWED_CHARACTERS
+from better_profanity.utils import get_complete_path_of_file, read_wordlist
+
+DEFAULT_WORDLIST = get_complete_path_of_file("profanity_wordlist.txt")
+CHARS_MAPPING = {
+    "a": ("a", "@", "*", "4"),
+    "i": ("i", "*", "l", "1"),
+    "o": ("o", "*", "0", "@"),
+    "u": ("u", "*", "v"),
+    "v": ("v", "*", "u"),
+    "l": ("l", "1"),
+    "e": ("e", "*", "3"),
+    "s": ("s", "$", "5"),
+    "t": ("t", "7"),
+}
+
+_WORD_PATTERN = re.compile(
+    "[" + "".join(re.escape(char) for char in sorted(ALLOWED_CHARACTERS)) + "]+"
+)
+
+
+class ProfanityFilter:
+    def __init__(self, words=None):
+        if words is None:
+            words = read_wordlist(DEFAULT_WORDLIST)
+        elif isinstance(words, str):
+            words = read_wordlist(words)
+
+        self.max_combinations = 1
+        children = [{}]
+        terminal = [False]
+        for word in {word.lower() for word in words}:
+            separators = sum(1 for char in word if char not in ALLOWED_CHARACTERS)
+            self.max_combinations = max(self.max_combinations, separators)
+
+            state = 0
+            for char in word:
+                nxt = children[state].get(char)
+                if nxt is None:
+                    nxt = len(children)
+                    children.append({})
+                    terminal.append(False)
+                    children[state][char] = nxt
+                state = nxt
+            terminal[state] = True
+
+        self._children = children
+        self._terminal = terminal
+
+        self._variants = {}
+        for char, variants in CHARS_MAPPING.items():
+            for variant in variants:
+                self._variants.setdefault(variant, set()).add(char)
+        for variant, chars in self._variants.items():
+            if variant not in CHARS_MAPPING:
+                chars.add(variant)
+        self._variants = {
+            variant: tuple(chars) for variant, chars in self._variants.items()
+        }
+
+        self._token_states = lru_cache(maxsize=8192)(self._advance_from_root)
+
+    def _advance(self, states, text: str):
+        children = self._children
+        variants = self._variants
+        for char in text:
+            candidates = variants.get(char, (char,))
+            states = {
+                children[state][candidate]
+                for state in states
+                for candidate in candidates
+                if candidate in children[state]
+            }
+            if not states:
+                break
+        return frozenset(states)
+
+    def _advance_from_root(self, token: str):
+        return self._advance((0,), token)
+
+    def _is_match(self, states):
+        terminal = self._terminal
+        return any(terminal[state] for state in states)
+
+    def contains_profanity(self, text: str):
+        matches = [
+            (match.start(), match.end()) for match in _WORD_PATTERN.finditer(text)
+        ]
+        if not matches:
+            return False
+
+        lowered = text.lower()
+        for index, (start, end) in enumerate(matches):
+            states = self._token_states(lowered[start:end])
+            if not states:
+                continue
+            if self._is_match(states):
+                return True
+
+            joined = separated = states
+            last_end = end
+            for next_start, next_end in matches[
+                index + 1 : index + 1 + self.max_combinations
+            ]:
+                word = lowered[next_start:next_end]
+                if joined:
+                    joined = self._advance(joined, word)
+                if separated:
+                    separated = self._advance(separated, lowered[last_end:next_end])
+                if not joined and not separated:
+                    break
+                if self._is_match(joined) or self._is_match(separated):
+                    return True
+                last_end = next_end
+        return False
@@ -0,0 +1,85 @@
+from collections import deque
+
+RAID_WINDOW_SLOTS = 64
+RAID_MIN_LENGTH = 8
+
+
+class RaidBucket:
+    __slots__ = ("last_seen", "authors", "pending")
+
+    def __init__(self):
+        self.last_seen = 0.0
+        self.authors = {}
+        self.pending = deque()
+
+    def expire(self, cutoff: float):
+        authors = self.authors
+        while authors:
+            author_id = next(iter(authors))
+            if authors[author_id] > cutoff:
+                break
+            del authors[author_id]
+
+        pending = self.pending
+        while pending and pending[0][0] <= cutoff:
+            pending.popleft()
+
+
+class RaidWindow:
+    __slots__ = ("author_limit", "buckets")
+
+    def __init__(self, author_limit: int):
+        self.author_limit = author_limit
+        self.buckets = {}
+
+    def __len__(self):
+        return len(self.buckets)
+
+    @property
+    def last_seen(self):
+        if not self.buckets:
+            return None
+        return self.buckets[next(reversed(self.buckets))].last_seen
+
+    def resize(self, author_limit: int):
+        self.author_limit = author_limit
+
+    def expire(self, cutoff: float):
+        buckets = self.buckets
+        while buckets:
+            content_hash = next(iter(buckets))
+            if buckets[content_hash].last_seen > cutoff:
+                break
+            del buckets[content_hash]
+
+    def push(
+        self,
+        timestamp: float,
+        cutoff: float,
+        content_hash: int,
+        message_id: int,
+        author_id: int,
+    ):
+        bucket = self.buckets.pop(content_hash, None)
+        if bucket is None:
+            bucket = RaidBucket()
+            if len(self.buckets) >= RAID_WINDOW_SLOTS:
+                del self.buckets[next(iter(self.buckets))]
+        self.buckets[content_hash] = bucket
+        bucket.last_seen = timestamp
+
+        bucket.expire(cutoff)
+        authors = bucket.authors
+        authors.pop(author_id, None)
+        while len(authors) >= self.author_limit:
+            del authors[next(iter(authors))]
+        authors[author_id] = timestamp
+        if len(authors) < self.author_limit:
+            if len(bucket.pending) >= self.author_limit * 2:
+                bucket.pending.popleft()
+            bucket.pending.append((timestamp, message_id, author_id))
+            return None
+
+        related = [(message_id, author_id) for _, message_id, author_id in bucket.pending]
+        bucket.pending.clear()
+        return related
@@ -0,0 +1,357 @@
+import time
+from collections import defaultdict
+
+from utils.domains import DomainPolicy
+from utils.metrics import CheckMetrics
+from utils.normalize import NormalizedMessage
+from utils.raid import RAID_MIN_LENGTH, RaidWindow
+from utils.similarity import MessageFingerprint
+from utils.windows import ExpiryWheel, SlidingWindow
+from utils.wordmatch import WordMatcher
+
+WINDOW_TTL = 300
+EVICTION_BUDGET = 500
+
+DEFAULT_THRESHOLDS = {
+    "spam_messages": 5,
+    "spam_seconds": 10,
+    "flood_messages": 5,
+    "flood_seconds": 5,
+    "emoji_limit": 5,
+    "caps_percent": 70,
+    "newline_limit": 15,
+    "zalgo_percent": 30,
+    "raid_messages": 5,
+    "raid_seconds": 30,
+}
+CAPS_MIN_LETTERS = 10
+
+
+class MessageRecord:
+    __slots__ = ("guild_id", "channel_id", "author_id", "message_id", "content")
+
+    def __init__(
+        self,
+        guild_id: int,
+        channel_id: int,
+        author_id: int,
+        message_id: int,
+        content: str,
+    ):
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.author_id = author_id
+        self.message_id = message_id
+        self.content = content
+
+    def __getstate__(self):
+        return (
+            self.guild_id,
+            self.channel_id,
+            self.author_id,
+            self.message_id,
+            self.content,
+        )
+
+    def __setstate__(self, state):
+        (
+            self.guild_id,
+            self.channel_id,
+            self.author_id,
+            self.message_id,
+            self.content,
+        ) = state
+
+    @classmethod
+    def from_message(cls, message):
+        return cls(
+            message.guild.id,
+            message.channel.id,
+            message.author.id,
+            message.id,
+            message.content,
+        )
+
+
+class AutoModEngine:
+    def __init__(self, rules: dict):
+        self.rules = rules
+        self.pipelines = {}
+        self.rule_versions = {}
+
+        self.user_messages = defaultdict(dict)
+        self.recent_messages = defaultdict(dict)
+        self.channel_contents = defaultdict(dict)
+        self.related_messages = []
+        self.expiry_wheel = ExpiryWheel(time.monotonic())
+
+        self._profanity_filter = None
+        self.metrics = CheckMetrics()
+
+    @property
+    def profanity_filter(self):
+        if self._profanity_filter is None:
+            from utils.profanity import ProfanityFilter
+
+            self._profanity_filter = ProfanityFilter()
+        return self._profanity_filter
+
+    def get_pipeline(self, guild_id: str):
+        pipeline = self.pipelines.get(guild_id)
+        if pipeline is None:
+            pipeline = self.compile_rules(guild_id)
+        return pipeline
+
+    def evaluate(self, record: MessageRecord):
+        pipeline = self.get_pipeline(str(record.guild_id))
+        if not pipeline:
+            return None
+
+        observe = self.metrics.observe
+        view = NormalizedMessage(record.content)
+        for reason, check in pipeline:
+            start = time.perf_counter_ns()
+            hit = check(record, view)
+            observe(record.guild_id, reason, time.perf_counter_ns() - start, hit)
+            if hit:
+                return reason
+        return None
+
+    def take_related_messages(self):
+        related = self.related_messages
+        self.related_messages = []
+        return related
+
+    def compile_rules(self, guild_id: str):
+        rules = self.rules.get(guild_id, {})
+        thresholds = {**DEFAULT_THRESHOLDS, **rules.get("thresholds", {})}
+        pipeline = []
+
+        if rules.get("blocked_words", False):
+            matcher = WordMatcher(rules.get("blocked_words_list", []))
+            if matcher:
+                pipeline.append(
+                    ("blocked word", lambda _, view: matcher.search_lowered(view.lower))
+                )
+
+        blocked_domains = rules.get("blocked_domains_list", [])
+        if rules.get("blocked_links", False) or blocked_domains:
+            policy = DomainPolicy(
+                rules.get("allowed_domains_list", []),
+                blocked_domains,
+                block_by_default=rules.get("blocked_links", False),
+            )
+            pipeline.append(
+                (
+                    "blocked link",
+                    lambda _, view: any(policy.is_blocked(host) for host in view.hosts),
+                )
+            )
+
+        if rules.get("profanity_filter", False):
+            pipeline.append(
+                ("profanity", lambda _, view: self.contains_profanity(view.content))
+            )
+
+        if rules.get("spam_detection", False):
+            spam_messages = thresholds["spam_messages"]
+            spam_seconds = thresholds["spam_seconds"]
+            pipeline.append(
+                (
+                    "spam",
+                    lambda record, view: self.is_spam(
+                        record, spam_messages, spam_seconds, view.fingerprint
+                    ),
+                )
+            )
+
+        emoji_enabled = rules.get("emoji_spam_detection", False)
+        text_enabled = rules.get("text_spam_detection", False)
+        emoji_limit = thresholds["emoji_limit"] if emoji_enabled else None
+        newline_limit = thresholds["newline_limit"] if text_enabled else None
+        zalgo_percent = thresholds["zalgo_percent"] if text_enabled else None
+        caps_percent = thresholds["caps_percent"]
+
+        def char_stats(view):
+            return view.char_stats(emoji_limit, newline_limit, zalgo_percent)
+
+        if emoji_enabled:
+            pipeline.append(
+                ("emoji spam", lambda _, view: char_stats(view).emoji > emoji_limit)
+            )
+
+        if text_enabled:
+            pipeline.append(
+                (
+                    "excessive caps",
+                    lambda _, view: self.contains_caps_spam(
+                        char_stats(view), caps_percent
+                    ),
+                )
+            )
+            pipeline.append(
+                (
+                    "newline spam",
+                    lambda _, view: char_stats(view).newlines > newline_limit,
+                )
+            )
+            pipeline.append(
+                (
+                    "zalgo text",
+                    lambda _, view: char_stats(view).combining * 100
+                    > zalgo_percent * char_stats(view).length,
+                )
+            )
+
+        if rules.get("raid_detection", False):
+            raid_messages = thresholds["raid_messages"]
+            raid_seconds = thresholds["raid_seconds"]
+            pipeline.append(
+                (
+                    "raid",
+                    lambda record, view: self.is_raid(
+                        record, view, raid_messages, raid_seconds
+                    ),
+                )
+            )
+
+        if rules.get("flood_control", False):
+            flood_messages = thresholds["flood_messages"]
+            flood_seconds = thresholds["flood_seconds"]
+            pipeline.append(
+                (
+                    "flood",
+                    lambda record, _: self.is_flood(
+                        record, flood_messages, flood_seconds
+                    ),
+                )
+            )
+
+        pipeline = tuple(pipeline)
+        self.pipelines[guild_id] = pipeline
+        self.rule_versions[guild_id] = self.rule_versions.get(guild_id, 0) + 1
+        return pipeline
+
+    def evict_expired(self, now: float, budget: int = EVICTION_BUDGET):
+        for windows, guild_id, key in self.expiry_wheel.pop_due(now, budget):
+            guild_windows = windows.get(guild_id)
+            window = guild_windows.get(key) if guild_windows else None
+            if window is None:
+                continue
+
+            last_seen = window.last_seen
+            if last_seen is not None and last_seen + WINDOW_TTL > now:
+                self.expiry_wheel.schedule(
+                    last_seen + WINDOW_TTL, (windows, guild_id, key)
+                )
+                continue
+
+            del guild_windows[key]
+            if not guild_windows:
+                del windows[guild_id]
+
+    def contains_profanity(self, content: str):
+        return self.profanity_filter.contains_profanity(content)
+
+    def contains_caps_spam(self, stats, caps_percent: int = 70):
+        if stats.letters < CAPS_MIN_LETTERS:
+            return False
+        return stats.uppercase * 100 > caps_percent * stats.letters
+
+    def get_window(
+        self, windows: dict, guild_id: int, key, capacity: int, factory=SlidingWindow
+    ):
+        guild_windows = windows[guild_id]
+        window = guild_windows.get(key)
+        if window is None:
+            window = guild_windows[key] = factory(capacity)
+            self.expiry_wheel.schedule(
+                time.monotonic() + WINDOW_TTL, (windows, guild_id, key)
+            )
+        else:
+            window.resize(capacity)
+        return window
+
+    def is_spam(
+        self,
+        record: MessageRecord,
+        message_limit: int = 5,
+        time_window: int = 10,
+        fingerprint: MessageFingerprint = None,
+    ):
+        now = time.monotonic()
+        capacity = message_limit + 1
+
+        window = self.get_window(
+            self.user_messages, record.guild_id, record.author_id, capacity
+        )
+
+        if fingerprint is None:
+            fingerprint = MessageFingerprint(record.content)
+        window.expire(now - time_window)
+        window.push(now, fingerprint)
+
+        if len(window) > message_limit:
+            return True
+
+        similar_messages = sum(
+            1
+            for entry in window
+            if self.messages_similar(entry.content, fingerprint)
+        )
+
+        return similar_messages > message_limit / 2
+
+    def messages_similar(
+        self,
+        msg1: MessageFingerprint,
+        msg2: MessageFingerprint,
+        threshold: float = 0.8,
+    ):
+        return msg1.similar(msg2, threshold)
+
+    def is_flood(
+        self, record: MessageRecord, message_limit: int = 5, time_window: int = 5
+    ):
+        now = time.monotonic()
+        key = (record.channel_id, record.author_id)
+
+        window = self.get_window(
+            self.recent_messages, record.guild_id, key, message_limit + 1
+        )
+
+        window.expire(now - time_window)
+        window.push(now)
+
+        return len(window) > message_limit
+
+    def is_raid(
+        self,
+        record: MessageRecord,
+        view: NormalizedMessage,
+        author_limit: int = 5,
+        time_window: int = 30,
+    ):
+        normalized = " ".join(view.tokens)
+        if len(normalized) < RAID_MIN_LENGTH:
+            return False
+
+        now = time.monotonic()
+        window = self.get_window(
+            self.channel_contents,
+            record.guild_id,
+            record.channel_id,
+            author_limit,
+            RaidWindow,
+        )
+
+        cutoff = now - time_window
+        window.expire(cutoff)
+        related = window.push(
+            now, cutoff, hash(normalized), record.message_id, record.author_id
+        )
+        if related is None:
+            return False
+
+        self.related_messages.extend(related)
+        return True
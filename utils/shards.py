@@ -0,0 +1,28 @@
+import math
+
+MAX_LISTED_SHARDS = 20
+
+
+def shard_latencies(bot):
+    latencies = getattr(bot, "latencies", None)
+    if latencies is None:
+        return [(0, bot.latency)]
+    return sorted(latencies)
+
+
+def format_latency(latency: float):
+    if latency is None or not math.isfinite(latency):
+        return "n/a"
+    return f"{round(latency * 1000)}ms"
+
+
+def format_shard_latencies(bot):
+    latencies = shard_latencies(bot)
+    lines = [
+        f"Shard {shard_id}: `{format_latency(latency)}`"
+        for shard_id, latency in latencies[:MAX_LISTED_SHARDS]
+    ]
+    hidden = len(latencies) - MAX_LISTED_SHARDS
+    if hidden > 0:
+        lines.append(f"...and {hidden} more")
+    return "\n".join(lines) or "n/a"
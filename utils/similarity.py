@@ -0,0 +1,40 @@
+import re
+
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+class MessageFingerprint:
+    __slots__ = ("short", "counts", "total")
+
+    def __init__(self, content: str):
+        if len(content) < 5:
+            self.short = content
+            self.counts = {}
+            self.total = 0
+            return
+
+        self.short = None
+        counts = {}
+        words = _NON_WORD.sub("", content.lower()).split()
+        for word in words:
+            token = hash(word)
+            counts[token] = counts.get(token, 0) + 1
+        self.counts = counts
+        self.total = len(words)
+
+    def similar(self, other: "MessageFingerprint", threshold: float = 0.8):
+        if self.short is not None or other.short is not None:
+            return self.short == other.short
+
+        if not self.total or not other.total:
+            return False
+
+        total_words = max(self.total, other.total)
+        if self.total < threshold * total_words:
+            return False
+
+        other_counts = other.counts
+        matching_words = sum(
+            count for token, count in self.counts.items() if token in other_counts
+        )
+        return matching_words / total_words >= threshold
@@ -0,0 +1,23 @@
+import time
+
+
+class StartupTimer:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.mark = self.started
+        self.phases = []
+        self.finished = False
+
+    def phase(self, name: str):
+        now = time.perf_counter()
+        self.phases.append((name, now - self.mark))
+        self.mark = now
+
+    def finish(self):
+        self.finished = True
+        return self.mark - self.started
+
+    def report(self):
+        lines = [f"  {name}: {seconds:.2f}s" for name, seconds in self.phases]
+        lines.append(f"  Total: {self.mark - self.started:.2f}s")
+        return "\n".join(lines)
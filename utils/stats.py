@@ -0,0 +1,101 @@
+import asyncio
+from collections import Counter
+
+RECONCILE_SECONDS = 3600
+
+
+class StatsRegistry:
+    def __init__(self, bot):
+        self.bot = bot
+        self.guild_members = {}
+        self.guild_shards = {}
+        self.shard_guilds = Counter()
+        self.users = 0
+        self.task = None
+
+    @property
+    def guilds(self):
+        return len(self.guild_members)
+
+    def start(self):
+        if self.task is None:
+            for event in ("on_guild_join", "on_guild_available"):
+                self.bot.add_listener(self.add_guild, event)
+            self.bot.add_listener(self.remove_guild, "on_guild_remove")
+            self.bot.add_listener(self.update_members, "on_member_join")
+            self.bot.add_listener(self.remove_member, "on_raw_member_remove")
+            self.task = asyncio.create_task(self.reconcile_periodically())
+
+    def close(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def add_guild(self, guild):
+        self.set_guild(guild.id, guild.shard_id, guild.member_count or 0)
+
+    async def remove_guild(self, guild):
+        members = self.guild_members.pop(guild.id, None)
+        if members is not None:
+            self.users -= members
+            shard_id = self.guild_shards.pop(guild.id)
+            self.shard_guilds[shard_id] -= 1
+
+    async def remove_member(self, payload):
+        guild = self.bot.get_guild(payload.guild_id)
+        if guild is not None:
+            await self.update_guild_members(guild)
+
+    async def update_members(self, member):
+        await self.update_guild_members(member.guild)
+
+    async def update_guild_members(self, guild):
+        if guild.id in self.guild_members:
+            self.users += (guild.member_count or 0) - self.guild_members[guild.id]
+            self.guild_members[guild.id] = guild.member_count or 0
+        else:
+            await self.add_guild(guild)
+
+    def set_guild(self, guild_id: int, shard_id: int, members: int):
+        previous = self.guild_members.get(guild_id)
+        if previous is not None:
+            self.users -= previous
+            self.shard_guilds[self.guild_shards[guild_id]] -= 1
+        self.guild_members[guild_id] = members
+        self.guild_shards[guild_id] = shard_id
+        self.shard_guilds[shard_id] += 1
+        self.users += members
+
+    def reconcile(self):
+        guild_members = {}
+        guild_shards = {}
+        for guild in self.bot.guilds:
+            guild_members[guild.id] = guild.member_count or 0
+            guild_shards[guild.id] = guild.shard_id
+
+        users = sum(guild_members.values())
+        if self.guild_members and (
+            len(guild_members) != self.guilds or users != self.users
+        ):
+            print(
+                f"Stats drifted: {self.guilds} servers/{self.users} users tracked, "
+                f"{len(guild_members)} servers/{users} users counted."
+            )
+
+        self.guild_members = guild_members
+        self.guild_shards = guild_shards
+        self.shard_guilds = Counter(guild_shards.values())
+        self.users = users
+
+    async def reconcile_periodically(self):
+        await self.bot.wait_until_ready()
+        while True:
+            await asyncio.sleep(RECONCILE_SECONDS)
+            self.reconcile()
+
+
+def get_stats(bot):
+    stats = getattr(bot, "stats", None)
+    if stats is None:
+        stats = bot.stats = StatsRegistry(bot)
+    return stats
@@ -0,0 +1,43 @@
+import hashlib
+import json
+
+TREE_HASH_FILE = "command_tree.hash"
+
+
+def tree_hash(bot):
+    commands = sorted(
+        (command.to_dict(bot.tree) for command in bot.tree.get_commands()),
+        key=lambda command: (command.get("type", 1), command["name"]),
+    )
+    payload = json.dumps(
+        {"application_id": bot.application_id, "commands": commands},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def read_tree_hash():
+    try:
+        with open(TREE_HASH_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def write_tree_hash(digest: str):
+    try:
+        with open(TREE_HASH_FILE, "w", encoding="utf-8") as f:
+            f.write(digest)
+    except OSError as e:
+        print(f"Failed to save {TREE_HASH_FILE}: {e}")
+
+
+async def sync_tree(bot, force: bool = False):
+    digest = tree_hash(bot)
+    if not force and digest == read_tree_hash():
+        return None
+
+    synced = await bot.tree.sync()
+    write_tree_hash(digest)
+    return synced
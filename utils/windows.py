@@ -0,0 +1,71 @@
+from collections import defaultdict, deque
+
+
+class WindowEntry:
+    __slots__ = ("timestamp", "content")
+
+    def __init__(self, timestamp: float, content):
+        self.timestamp = timestamp
+        self.content = content
+
+
+class SlidingWindow:
+    __slots__ = ("entries",)
+
+    def __init__(self, capacity: int):
+        self.entries = deque(maxlen=capacity)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    @property
+    def last_seen(self):
+        return self.entries[-1].timestamp if self.entries else None
+
+    def resize(self, capacity: int):
+        if self.entries.maxlen != capacity:
+            self.entries = deque(self.entries, maxlen=capacity)
+
+    def push(self, timestamp: float, content=None):
+        self.entries.append(WindowEntry(timestamp, content))
+
+    def expire(self, cutoff: float):
+        entries = self.entries
+        while entries and entries[0].timestamp <= cutoff:
+            entries.popleft()
+
+
+class ExpiryWheel:
+    __slots__ = ("resolution", "buckets", "cursor", "pending")
+
+    def __init__(self, start: float, resolution: float = 5.0):
+        self.resolution = resolution
+        self.buckets = defaultdict(deque)
+        self.cursor = int(start // resolution)
+        self.pending = 0
+
+    def __len__(self):
+        return self.pending
+
+    def schedule(self, deadline: float, item):
+        tick = max(int(deadline // self.resolution) + 1, self.cursor)
+        self.buckets[tick].append(item)
+        self.pending += 1
+
+    def pop_due(self, now: float, budget: int):
+        due = []
+        now_tick = int(now // self.resolution)
+        while self.cursor <= now_tick and len(due) < budget:
+            bucket = self.buckets.get(self.cursor)
+            if bucket is not None:
+                while bucket and len(due) < budget:
+                    due.append(bucket.popleft())
+                if bucket:
+                    break
+                del self.buckets[self.cursor]
+            self.cursor += 1
+        self.pending -= len(due)
+        return due
@@ -0,0 +1,62 @@
+from collections import deque
+
+
+class WordMatcher:
+    __slots__ = ("words", "_goto", "_fail", "_out")
+
+    def __init__(self, words):
+        self.words = tuple(dict.fromkeys(w.lower() for w in words if w))
+
+        goto = [{}]
+        out = [False]
+        for word in self.words:
+            state = 0
+            for char in word:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    out.append(False)
+                    goto[state][char] = nxt
+                state = nxt
+            out[state] = True
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[nxt] = goto[fallback].get(char, 0)
+                out[nxt] = out[nxt] or out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def __bool__(self):
+        return bool(self.words)
+
+    def search(self, text: str):
+        return self.search_lowered(text.lower())
+
+    def search_lowered(self, text: str):
+        if not self.words:
+            return False
+
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        state = 0
+        for char in text:
+            nxt = goto[state].get(char)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(char)
+            state = nxt or 0
+            if out[state]:
+                return True
+        return False